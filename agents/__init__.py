@@ -1,10 +1,17 @@
 """
 Multi-Agent System for AI News Researcher
+
+Agents are imported lazily on first attribute access, so `import agents`
+doesn't pull in openai, feedparser, etc. until an agent is actually used.
 """
-from .base_agent import BaseAgent
-from .news_fetcher_agent import NewsFetcherAgent
-from .summarizer_agent import SummarizerAgent
-from .compiler_agent import DigestCompilerAgent
+from importlib import import_module
+
+_AGENT_MODULES = {
+    'BaseAgent': '.base_agent',
+    'NewsFetcherAgent': '.news_fetcher_agent',
+    'SummarizerAgent': '.summarizer_agent',
+    'DigestCompilerAgent': '.compiler_agent'
+}
 
 __all__ = [
     'BaseAgent',
@@ -13,3 +20,11 @@ __all__ = [
     'DigestCompilerAgent'
 ]
 
+
+def __getattr__(name):
+    if name in _AGENT_MODULES:
+        value = getattr(import_module(_AGENT_MODULES[name], __name__), name)
+        # Cache on the package so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,27 @@
 """
 Base Agent class for all agents in the system
 """
-from openai import OpenAI
-from typing import Dict, Any, Optional
+import asyncio
+import json
+from typing import Dict, Any, List, Optional
+from .llm_cache import LLMCache
+from .rate_limiter import get_rate_limiter
 import config
 
+# HTTP/2 multiplexes concurrent completions over a few TLS connections
+# instead of one HTTP/1.1 connection (and handshake) per in-flight request
+LLM_POOL_SIZE = 50
+LLM_KEEPALIVE_CONNECTIONS = 20
+
+
+def _http_client_options() -> Dict[str, Any]:
+    """Connection settings shared by the sync and async OpenAI HTTP clients"""
+    import httpx
+    return {
+        "http2": True,
+        "limits": httpx.Limits(max_connections=LLM_POOL_SIZE, max_keepalive_connections=LLM_KEEPALIVE_CONNECTIONS)
+    }
+
 
 class BaseAgent:
     """Base class for all agents in the multi-agent system"""
@@ -21,19 +38,68 @@ class BaseAgent:
         self.name = name
         self.role = role
         self.instructions = instructions
-        self.client = OpenAI(api_key=config.OPENAI_API_KEY)
+        # Imported here: openai is the heaviest dependency, and only agent construction needs it
+        from openai import OpenAI, DefaultHttpxClient
+        # The SDK retries 429s, timeouts and 5xx with exponential backoff (honouring Retry-After)
+        self.client = OpenAI(
+            api_key=config.OPENAI_API_KEY,
+            max_retries=config.LLM_MAX_RETRIES,
+            http_client=DefaultHttpxClient(**_http_client_options())
+        )
+        self._async_client = None
+        self._async_client_loop = None
+        self.rate_limiter = get_rate_limiter()
         self.model = config.OPENAI_MODEL
+        self.temperature = config.OPENAI_TEMPERATURE
+        self.cache = self._create_cache()
         
-    def execute(self, task: str, context: Optional[Dict[str, Any]] = None) -> str:
+    @property
+    def async_client(self):
         """
-        Execute a task using the agent with timeout protection
+        AsyncOpenAI client for the running event loop
         
-        Args:
-            task: The task description
-            context: Additional context for the task
-            
-        Returns:
-            The agent's response
+        Its connection pool belongs to the loop that opened it, so reusing one
+        client under a later asyncio.run() fails with "Event loop is closed";
+        a long-lived agent gets a fresh client for each loop instead.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+            self._async_client = AsyncOpenAI(
+                api_key=config.OPENAI_API_KEY,
+                max_retries=config.LLM_MAX_RETRIES,
+                http_client=DefaultAsyncHttpxClient(**_http_client_options())
+            )
+            self._async_client_loop = loop
+        return self._async_client
+    
+    async def aclose(self) -> None:
+        """Close the async client's connection pool; call before the event loop ends"""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+            self._async_client_loop = None
+    
+    def _create_cache(self) -> Optional[LLMCache]:
+        """
+        Create the response cache if caching is enabled
+        
+        Sampled (temperature > 0) responses differ between calls, so they are
+        only cached when config.LLM_CACHE_NONDETERMINISTIC explicitly allows it.
+        """
+        if not config.LLM_CACHE_ENABLED:
+            return None
+        if self.temperature > 0 and not config.LLM_CACHE_NONDETERMINISTIC:
+            return None
+        return LLMCache(cache_dir=config.LLM_CACHE_DIRECTORY, ttl_days=config.LLM_CACHE_TTL_DAYS)
+    
+    def _build_messages(self, task: str, context: Optional[Dict[str, Any]] = None) -> List[Dict[str, str]]:
+        """
+        Build the chat messages shared by the sync and async execution paths
+        
+        The system instructions never change between calls and dynamic content
+        only ever goes at the end of the user message, keeping the request prefix
+        stable for OpenAI's automatic prompt caching.
         """
         messages = [
             {"role": "system", "content": self.instructions},
@@ -44,21 +110,187 @@ class BaseAgent:
             context_str = "\n\nContext:\n" + "\n".join([f"{k}: {v}" for k, v in context.items()])
             messages[1]["content"] += context_str
         
+        return messages
+    
+    @staticmethod
+    def _request_options(response_format: Optional[Dict[str, Any]] = None,
+                         max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Optional completion parameters; unset ones are left out so old cache keys still match"""
+        options = {}
+        if response_format is not None:
+            options["response_format"] = response_format
+        if max_tokens is not None:
+            options["max_tokens"] = max_tokens
+        return options
+    
+    def _cache_key(self, messages: List[Dict[str, str]], options: Dict[str, Any]) -> Optional[str]:
+        """Key for a request, or None when caching is disabled"""
+        if self.cache is None:
+            return None
+        request = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            **options
+        }
+        return LLMCache.make_key(request)
+    
+    def _format_error(self, error: Exception) -> str:
+        """Turn an API failure into the error string callers already expect"""
+        error_msg = str(error)
+        if "timeout" in error_msg.lower():
+            return f"Error: API call timed out after {config.API_CALL_TIMEOUT_SECONDS} seconds"
+        return f"Error executing task: {error_msg}"
+    
+    @staticmethod
+    def is_error_response(response: Optional[str]) -> bool:
+        """True for empty replies and the error strings returned by execute()/aexecute()"""
+        return not response or response.startswith("Error")
+    
+    @staticmethod
+    def _json_schema_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Structured-output response_format for a strict JSON schema"""
+        return {
+            "type": "json_schema",
+            "json_schema": {"name": name, "strict": True, "schema": schema}
+        }
+    
+    def _complete(self, messages: List[Dict[str, str]],
+                  response_format: Optional[Dict[str, Any]] = None,
+                  max_tokens: Optional[int] = None) -> str:
+        """Run one chat completion through the cache; API errors propagate"""
+        options = self._request_options(response_format, max_tokens)
+        key = self._cache_key(messages, options)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        # Add timeout to API call
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            timeout=config.API_CALL_TIMEOUT_SECONDS,
+            **options
+        )
+        content = response.choices[0].message.content
+        
+        if key is not None and content:
+            self.cache.set(key, content)
+        return content
+    
+    async def _acomplete(self, messages: List[Dict[str, str]],
+                         response_format: Optional[Dict[str, Any]] = None,
+                         max_tokens: Optional[int] = None) -> str:
+        """Async counterpart of _complete()"""
+        options = self._request_options(response_format, max_tokens)
+        key = self._cache_key(messages, options)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            timeout=config.API_CALL_TIMEOUT_SECONDS,
+            **options
+        )
+        content = response.choices[0].message.content
+        
+        if key is not None and content:
+            self.cache.set(key, content)
+        return content
+    
+    def execute(self, task: str, context: Optional[Dict[str, Any]] = None,
+                max_tokens: Optional[int] = None) -> str:
+        """
+        Execute a task using the agent with timeout protection
+        
+        Args:
+            task: The task description
+            context: Additional context for the task
+            max_tokens: Cap on the response length (None for the model default)
+            
+        Returns:
+            The agent's response
+        """
         try:
-            # Add timeout to API call
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=0.7,
-                timeout=config.API_CALL_TIMEOUT_SECONDS
+            return self._complete(self._build_messages(task, context), max_tokens=max_tokens)
+        except Exception as e:
+            return self._format_error(e)
+    
+    async def aexecute(self, task: str, context: Optional[Dict[str, Any]] = None,
+                       max_tokens: Optional[int] = None) -> str:
+        """
+        Async counterpart of execute() so independent calls can overlap on the wire
+        
+        Args:
+            task: The task description
+            context: Additional context for the task
+            max_tokens: Cap on the response length (None for the model default)
+            
+        Returns:
+            The agent's response
+        """
+        try:
+            return await self._acomplete(self._build_messages(task, context), max_tokens=max_tokens)
+        except Exception as e:
+            return self._format_error(e)
+    
+    def execute_json(self, task: str, schema: Dict[str, Any], name: str = "response",
+                     context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute a task whose reply must match a JSON schema (structured output)
+        
+        Unlike execute(), failures raise instead of returning an error string,
+        so callers can't mistake an error message for a parseable answer.
+        
+        Args:
+            task: The task description
+            schema: JSON schema the response must satisfy (strict mode)
+            name: Schema name reported to the API
+            context: Additional context for the task
+            
+        Returns:
+            The parsed JSON response
+            
+        Raises:
+            ValueError: If the API call fails or the reply is not valid JSON
+        """
+        try:
+            content = self._complete(
+                self._build_messages(task, context),
+                response_format=self._json_schema_format(name, schema)
             )
-            return response.choices[0].message.content
         except Exception as e:
-            error_msg = str(e)
-            if "timeout" in error_msg.lower():
-                return f"Error: API call timed out after {config.API_CALL_TIMEOUT_SECONDS} seconds"
-            return f"Error executing task: {error_msg}"
+            raise ValueError(self._format_error(e)) from e
+        return json.loads(content or "")
+    
+    async def aexecute_json(self, task: str, schema: Dict[str, Any], name: str = "response",
+                            context: Optional[Dict[str, Any]] = None,
+                            max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Async counterpart of execute_json()
+        
+        Raises:
+            ValueError: If the API call fails or the reply is not valid JSON
+        """
+        try:
+            content = await self._acomplete(
+                self._build_messages(task, context),
+                response_format=self._json_schema_format(name, schema),
+                max_tokens=max_tokens
+            )
+        except Exception as e:
+            raise ValueError(self._format_error(e)) from e
+        return json.loads(content or "")
     
     def __str__(self):
         return f"{self.name} ({self.role})"
-
@@ -1,12 +1,25 @@
 """
 Digest Compiler Agent - Responsible for compiling summaries into a formatted digest
 """
-from typing import List, Dict, Any
+import os
+import re
+from typing import List, Dict, Any, Iterable, Iterator, Set, Tuple, Union
 from datetime import datetime
 from .base_agent import BaseAgent
 import config
 
 
+# Theme bullets look like "- **Label**: explanation", "1. Label - explanation", etc.
+# Only top-level bullets count: indented sub-bullets ("   - Explanation: ...") are details
+THEME_LINE_PATTERN = re.compile(
+    r"^(?:[-*\u2022]|\d+[.)])\s+(?:\*\*(?P<bold>[^*]+)\*\*|(?P<plain>.+?)(?::|\s[-\u2013\u2014]\s|$))"
+)
+WORD_PATTERN = re.compile(r"[a-z0-9]+")
+MIN_THEME_WORD_LENGTH = 4  # Skip short words like "ai", "and", "of" when matching
+OTHER_THEME_LABEL = "Other AI News"
+DIGEST_WRITE_BUFFER = 1 << 20  # 1 MiB: a typical digest is flushed in a single write
+
+
 class DigestCompilerAgent(BaseAgent):
     """Agent specialized in compiling AI news summaries into a digest format"""
     
@@ -27,7 +40,10 @@ Create AI news digests that busy tech professionals and AI enthusiasts will actu
         
     def compile_digest(self, articles: List[Dict[str, Any]], themes: str = None) -> str:
         """
-        Compile AI articles into a formatted digest
+        Compile AI articles into a formatted digest with an LLM call
+        
+        Only used when config.USE_LLM_COMPILATION is set; format_digest_markdown
+        renders the same content locally without spending tokens.
         
         Args:
             articles: List of summarized AI articles
@@ -74,74 +90,197 @@ Make it informative, scannable, and engaging for AI enthusiasts and tech profess
         print(f"[{self.name}] AI news digest compiled successfully!")
         return digest
     
-    def format_digest_markdown(self, articles: List[Dict[str, Any]], themes: str = None) -> str:
+    @staticmethod
+    def _parse_theme_labels(themes: str) -> List[str]:
         """
-        Format AI news digest in Markdown
+        Pull the theme names out of the bullet list returned by identify_themes
+        
+        When any label is bold, only bold labels are kept, so unbolded detail
+        lines in the same list aren't mistaken for themes.
+        """
+        bold_labels, plain_labels = [], []
+        for line in themes.splitlines():
+            match = THEME_LINE_PATTERN.match(line)
+            if match:
+                label = (match.group("bold") or match.group("plain") or "").strip(" *:.-")
+                if label:
+                    (bold_labels if match.group("bold") else plain_labels).append(label)
+        return bold_labels or plain_labels
+    
+    @staticmethod
+    def _group_by_theme(article_words: List[Set[str]],
+                        labels: List[str]) -> List[Tuple[str, List[int]]]:
+        """
+        Bucket articles under the theme whose label words they mention most
+        
+        A plain word-overlap match is enough here: the themes were derived from
+        these same articles, so their labels reuse the articles' vocabulary.
+        
+        Args:
+            article_words: Each article's lowercase title and summary words
+            labels: Theme labels, in display order
+            
+        Returns:
+            (label, article indices) pairs for the non-empty groups
+        """
+        label_words = {
+            label: {word for word in WORD_PATTERN.findall(label.lower()) if len(word) >= MIN_THEME_WORD_LENGTH}
+            for label in labels
+        }
+        groups = {label: [] for label in labels}
+        groups[OTHER_THEME_LABEL] = []
+        
+        for i, words in enumerate(article_words):
+            best_label, best_hits = OTHER_THEME_LABEL, 0
+            for label in labels:
+                hits = len(label_words[label] & words)
+                if hits > best_hits:
+                    best_label, best_hits = label, hits
+            groups[best_label].append(i)
+        
+        return [(label, group) for label, group in groups.items() if group]
+    
+    def prepare_scaffold(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Render the parts of the markdown digest that don't depend on the themes
+        
+        Split from finish() so this work can run while the theme call is
+        still in flight.
         
         Args:
             articles: List of summarized AI articles
-            themes: Optional identified AI themes
             
         Returns:
-            Markdown formatted AI news digest
+            Scaffold to pass to finish()
         """
-        current_date = datetime.now().strftime("%B %d, %Y")
+        # One timestamp for the whole digest so the date and footer can't straddle midnight
+        now = datetime.now()
+        current_date = now.strftime("%B %d, %Y")
+        source_count = len({article['source'] for article in articles})
         
         # Header
-        markdown = f"""# AI News Digest
+        header = f"""# AI News Digest
 ## {current_date}
 
+Today's digest covers {len(articles)} AI stories from {source_count} source{"s" if source_count != 1 else ""}.
+
 ---
 
 """
         
-        # Introduction
-        if themes:
-            markdown += f"""### Today's Key Themes
-{themes}
+        # Article bodies; the "### N. title" line is added once the numbering is known
+        blocks = []
+        for article in articles:
+            summary = article.get('ai_summary', '')
+            blocks.append(f"""**Source:** {article['source']}  
+**Link:** [{article['link']}]({article['link']})
+
+{summary}
 
 ---
 
-"""
+""")
         
-        # Articles
-        markdown += "## Top Stories\n\n"
+        return {
+            "articles": articles,
+            "now": now,
+            "header": header,
+            "blocks": blocks,
+            "words": [
+                set(WORD_PATTERN.findall(f"{article['title']} {article.get('ai_summary', '')}".lower()))
+                for article in articles
+            ]
+        }
+    
+    def iter_digest(self, scaffold: Dict[str, Any], themes: str = None) -> Iterator[str]:
+        """
+        Complete a digest from prepare_scaffold(), one section at a time
         
-        for i, article in enumerate(articles, 1):
-            summary = article.get('ai_summary', '')
+        save_digest() writes the sections straight to disk, so the finished
+        digest never has to exist as one string.
+        
+        Args:
+            scaffold: Output of prepare_scaffold()
+            themes: Optional identified AI themes
             
-            markdown += f"""### {i}. {article['title']}
-
-**Source:** {article['source']}  
-**Link:** [{article['link']}]({article['link']})
-
-{summary}
+        Yields:
+            Consecutive pieces of the Markdown digest
+        """
+        articles = scaffold["articles"]
+        now = scaffold["now"]
+        labels = self._parse_theme_labels(themes) if themes else []
+        groups = (self._group_by_theme(scaffold["words"], labels) if labels
+                  else [("Top Stories", list(range(len(articles))))])
+        
+        yield scaffold["header"]
+        
+        # Introduction
+        if themes:
+            yield f"""### Today's Key Themes
+{themes}
 
 ---
 
 """
         
+        # Articles, numbered continuously across theme sections
+        number = 0
+        for label, group in groups:
+            yield f"## {label}\n\n"
+            for i in group:
+                number += 1
+                yield f"### {number}. {articles[i]['title']}\n\n"
+                yield scaffold["blocks"][i]
+        
         # Footer
-        markdown += f"""
+        yield f"""
+*That's {len(articles)} stories across {len(groups)} sections for {now.strftime("%B %d, %Y")}.*
+
 *This digest was compiled by AI News Researcher Agent*  
-*Generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}*
+*Generated on {now.strftime("%Y-%m-%d %H:%M:%S")}*
 """
+    
+    def finish(self, scaffold: Dict[str, Any], themes: str = None) -> str:
+        """
+        Complete a digest from prepare_scaffold() once the themes are known
+        
+        Args:
+            scaffold: Output of prepare_scaffold()
+            themes: Optional identified AI themes
+            
+        Returns:
+            Markdown formatted AI news digest
+        """
+        return "".join(self.iter_digest(scaffold, themes))
+    
+    def format_digest_markdown(self, articles: List[Dict[str, Any]], themes: str = None) -> str:
+        """
+        Format AI news digest in Markdown
         
-        return markdown
+        Rendered locally from the existing summaries, with no LLM call; stories
+        are grouped under the identified themes when there are any.
+        
+        Args:
+            articles: List of summarized AI articles
+            themes: Optional identified AI themes
+            
+        Returns:
+            Markdown formatted AI news digest
+        """
+        return self.finish(self.prepare_scaffold(articles), themes)
     
-    def save_digest(self, digest: str, filename: str = None) -> str:
+    def save_digest(self, digest: Union[str, Iterable[str]], filename: str = None) -> str:
         """
         Save digest to file
         
         Args:
-            digest: The digest content
+            digest: The digest content, as one string or as consecutive
+                sections (e.g. from iter_digest())
             filename: Optional custom filename
             
         Returns:
             Path to saved file
         """
-        import os
-        
         # Create output directory if it doesn't exist
         os.makedirs(config.OUTPUT_DIRECTORY, exist_ok=True)
         
@@ -152,9 +291,15 @@ Make it informative, scannable, and engaging for AI enthusiasts and tech profess
         
         filepath = os.path.join(config.OUTPUT_DIRECTORY, filename)
         
-        # Save file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(digest)
+        # Write to a temp file and rename, so readers (e.g. the JSON export)
+        # never see a half-written digest. Sections go through one large
+        # buffer, so the OS sees a few big writes rather than one per section.
+        sections = [digest] if isinstance(digest, str) else digest
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8', newline='', buffering=DIGEST_WRITE_BUFFER) as f:
+            for section in sections:
+                f.write(section)
+        os.replace(tmp_path, filepath)
         
         print(f"\n[{self.name}] Digest saved to: {filepath}")
         return filepath
@@ -0,0 +1,110 @@
+"""
+Conditional-GET cache for RSS feeds (ETag / Last-Modified)
+"""
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+
+class FeedCache:
+    """Remembers each feed's validators and last body so unchanged feeds return 304"""
+    
+    INDEX_FILE = "etags.json"
+    
+    def __init__(self, cache_dir: str = ".feed_cache"):
+        """
+        Initialize the cache and load the validator index
+        
+        Args:
+            cache_dir: Directory holding the index and cached feed bodies
+        """
+        self.cache_dir = cache_dir
+        # Feeds are fetched from worker threads
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+        self._dirty = False
+    
+    def _load_index(self) -> Dict[str, Dict[str, Optional[str]]]:
+        try:
+            with open(os.path.join(self.cache_dir, self.INDEX_FILE), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _body_path(self, feed_url: str) -> str:
+        name = hashlib.sha256(feed_url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.xml")
+    
+    def conditional_headers(self, feed_url: str) -> Dict[str, str]:
+        """
+        Request headers that let the server answer 304 Not Modified
+        
+        Args:
+            feed_url: URL of the feed
+            
+        Returns:
+            If-None-Match / If-Modified-Since headers
+        """
+        with self._lock:
+            entry = self._index.get(feed_url)
+        if not entry:
+            return {}
+        
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def load_body(self, feed_url: str) -> Optional[bytes]:
+        """
+        Cached body for a feed, used when the server answers 304
+        
+        Args:
+            feed_url: URL of the feed
+            
+        Returns:
+            The body stored by the last 200 response, or None
+        """
+        try:
+            with open(self._body_path(feed_url), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def store(self, feed_url: str, etag: Optional[str], last_modified: Optional[str], body: bytes) -> None:
+        """
+        Remember a fresh (200) response
+        
+        Args:
+            feed_url: URL of the feed
+            etag: ETag response header
+            last_modified: Last-Modified response header
+            body: Full response body
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._body_path(feed_url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+        
+        with self._lock:
+            self._index[feed_url] = {"etag": etag, "last_modified": last_modified}
+            self._dirty = True
+    
+    def save(self) -> None:
+        """Persist the validator index (call once after all fetches finish)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, self.INDEX_FILE)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._index, f, indent=2)
+            os.replace(tmp_path, path)
+            self._dirty = False
@@ -0,0 +1,242 @@
+"""
+Disk-backed caches for LLM responses
+
+LLMCache matches requests exactly by SHA-256; SemanticLLMCache matches
+near-identical inputs by embedding similarity.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+# numpy is only needed by SemanticLLMCache; import it there so the exact-match
+# cache (and every agent) doesn't pay for it
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class LLMCache:
+    """Stores one JSON file per prompt so repeated runs skip identical API calls"""
+    
+    def __init__(self, cache_dir: str = ".llm_cache", ttl_days: int = 7):
+        """
+        Initialize the cache
+        
+        Args:
+            cache_dir: Directory holding the cached responses
+            ttl_days: Entries older than this are treated as misses
+        """
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+    
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """Hash a request payload; sort_keys keeps the key stable across dict orderings"""
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _path(self, key: str) -> str:
+        # Shard by key prefix so no single directory grows unbounded
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response
+        
+        Args:
+            key: Key produced by make_key()
+            
+        Returns:
+            The cached response, or None on a miss or expired entry
+        """
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            return None
+        return entry.get("response")
+    
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response
+        
+        Args:
+            key: Key produced by make_key()
+            value: Response text to cache
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        # Write-then-rename so a concurrent reader never sees a half-written file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"created_at": time.time(), "response": value}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+class SemanticLLMCache:
+    """
+    Reuses a response when a new input is a near-duplicate of one already answered
+    
+    New entries are kept in memory and written to disk by flush(), once per
+    run rather than on every set().
+    """
+    
+    EMBEDDINGS_FILE = "embs.npy"
+    RESPONSES_FILE = "responses.json"
+    INITIAL_CAPACITY = 64  # Rows allocated up front; the matrix doubles when full
+    
+    def __init__(self, client, cache_dir: str = ".llm_cache/semantic", threshold: float = 0.92,
+                 model: str = "text-embedding-3-small", rate_limiter=None,
+                 ttl_days: Optional[float] = None):
+        """
+        Initialize the cache and load any previously stored entries
+        
+        Args:
+            client: OpenAI client used to compute embeddings
+            cache_dir: Directory holding the embedding matrix and responses
+            threshold: Minimum cosine similarity that counts as a hit
+            model: Embedding model
+            rate_limiter: Shared RateLimiter the embedding calls draw from, or None
+            ttl_days: Maximum age of an entry, or None to keep entries forever
+        """
+        self.client = client
+        self.rate_limiter = rate_limiter
+        self.cache_dir = cache_dir
+        self.threshold = threshold
+        self.model = model
+        self.ttl_seconds = ttl_days * 86400 if ttl_days is not None else None
+        self._lock = threading.Lock()
+        # get() followed by set() for the same text should only pay for one embedding
+        self._recent_embeddings: Dict[str, "np.ndarray"] = {}
+        # Rows [0, _size) of _matrix are in use; _entries holds their responses and timestamps
+        self._matrix, self._entries = self._load()
+        self._size = len(self._entries)
+        self._dirty = False
+    
+    def _is_expired(self, entry: Dict[str, Any], now: float) -> bool:
+        return self.ttl_seconds is not None and now - entry.get("created_at", 0) > self.ttl_seconds
+    
+    def _load(self):
+        import numpy as np
+        
+        matrix_path = os.path.join(self.cache_dir, self.EMBEDDINGS_FILE)
+        responses_path = os.path.join(self.cache_dir, self.RESPONSES_FILE)
+        try:
+            matrix = np.load(matrix_path)
+            with open(responses_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return None, []
+        
+        # A crash between the two writes can leave the files out of step; start fresh rather than mismatch
+        if (matrix.ndim != 2 or len(matrix) != len(entries)
+                or not all(isinstance(entry, dict) for entry in entries)):
+            return None, []
+        
+        now = time.time()
+        keep = [i for i, entry in enumerate(entries) if not self._is_expired(entry, now)]
+        if not keep:
+            return None, []
+        return matrix[keep], [entries[i] for i in keep]
+    
+    def _embed(self, text: str) -> "np.ndarray":
+        import numpy as np
+        
+        embedding = self._recent_embeddings.get(text)
+        if embedding is None:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            result = self.client.embeddings.create(model=self.model, input=text)
+            embedding = np.asarray(result.data[0].embedding, dtype=np.float32)
+            # Store unit vectors so lookup is a plain dot product
+            embedding /= np.linalg.norm(embedding) or 1.0
+            self._recent_embeddings[text] = embedding
+        return embedding
+    
+    def get(self, text: str) -> Optional[str]:
+        """
+        Look up the response for the most similar cached input
+        
+        Args:
+            text: Input to match against cached entries
+            
+        Returns:
+            The cached response if similarity exceeds the threshold, else None
+            (also when the embedding call fails)
+        """
+        import numpy as np
+        from openai import OpenAIError
+        
+        try:
+            query = self._embed(text)
+        except OpenAIError as e:
+            # The cache is an optimization; a failed lookup is just a miss
+            print(f"  [-] Semantic cache lookup skipped: {str(e)}")
+            return None
+        with self._lock:
+            if not self._size:
+                return None
+            scores = self._matrix[:self._size] @ query
+            best = int(np.argmax(scores))
+            entry = self._entries[best]
+            if scores[best] > self.threshold and not self._is_expired(entry, time.time()):
+                self._recent_embeddings.pop(text, None)
+                return entry["response"]
+        return None
+    
+    def set(self, text: str, value: str) -> None:
+        """
+        Store a response for an input (in memory until flush())
+        
+        Args:
+            text: Input the response was generated for
+            value: Response text to cache
+        """
+        import numpy as np
+        from openai import OpenAIError
+        
+        try:
+            embedding = self._embed(text)
+        except OpenAIError as e:
+            print(f"  [-] Semantic cache store skipped: {str(e)}")
+            return
+        with self._lock:
+            self._recent_embeddings.pop(text, None)
+            if self._matrix is None:
+                self._matrix = np.empty((self.INITIAL_CAPACITY, len(embedding)), dtype=np.float32)
+            elif self._size == len(self._matrix):
+                # Grow geometrically so appends stay amortized O(1)
+                self._matrix = np.concatenate([self._matrix, np.empty_like(self._matrix)])
+            self._matrix[self._size] = embedding
+            self._size += 1
+            self._entries.append({"created_at": time.time(), "response": value})
+            self._dirty = True
+    
+    def flush(self) -> None:
+        """Write entries added since the last flush to disk"""
+        import numpy as np
+        
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(self.cache_dir, exist_ok=True)
+            matrix_path = os.path.join(self.cache_dir, self.EMBEDDINGS_FILE)
+            responses_path = os.path.join(self.cache_dir, self.RESPONSES_FILE)
+            
+            # Write-then-rename so a reader never sees a half-written file
+            tmp_path = f"{matrix_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, self._matrix[:self._size])
+            os.replace(tmp_path, matrix_path)
+            
+            tmp_path = f"{responses_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, responses_path)
+            self._dirty = False
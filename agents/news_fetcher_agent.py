@@ -1,14 +1,195 @@
 """
 News Fetcher Agent - Responsible for collecting news from various sources
 """
-import feedparser
-import requests
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
-from dateutil import parser as date_parser
+import asyncio
+import inspect
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Iterator, Optional, Tuple
+from xml.etree import ElementTree
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from .base_agent import BaseAgent
+from .feed_cache import FeedCache
 import config
-import signal
+
+# requests, aiohttp, feedparser and dateutil are imported where they are first needed,
+# so importing the agents package stays cheap
+if TYPE_CHECKING:
+    import aiohttp
+    import requests
+
+
+# MinHash permutations for title deduplication; 64 is plenty for short titles
+DEDUP_NUM_PERM = 64
+
+# Query parameters that only track the referrer; dropped when comparing URLs.
+# Generic names like "ref" and "source" are left alone: some sites route on them
+TRACKING_PARAM_PREFIXES = ("utm_", "mc_")
+TRACKING_PARAMS = {"fbclid", "gclid", "guccounter"}
+
+# Local newsworthiness scoring
+RECENCY_DECAY_HOURS = 48  # Score falls to ~37% after this many hours
+DEFAULT_SOURCE_AUTHORITY = 0.5  # Weight for sources missing from config.SOURCE_AUTHORITY
+KEYWORD_HIT_WEIGHT = 0.1  # Bonus per AI keyword occurrence
+
+# One pooled session for all feed fetches: keep-alive lets feeds on the same
+# host (and repeat runs in one process) skip the TCP + TLS handshake
+FEED_POOL_SIZE = 16
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Streaming feed parsing
+FEED_CHUNK_SIZE = 16 * 1024  # Bytes read from the socket per parser feed
+FEED_ENTRY_TAGS = {"item", "entry"}  # RSS 2.0 / Atom entry elements
+
+
+def _get_session() -> "requests.Session":
+    """Shared feed session, created on first use (worker threads may race here)"""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            adapter = HTTPAdapter(
+                pool_connections=FEED_POOL_SIZE,
+                pool_maxsize=FEED_POOL_SIZE,
+                max_retries=Retry(total=config.MAX_RETRIES, backoff_factor=0.3)
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SESSION = session
+    return _SESSION
+
+
+@lru_cache(maxsize=1024)
+def _parse_published_date(value: str) -> Optional[datetime]:
+    """
+    Parse a feed date string into a naive UTC datetime, or None if unparseable
+    
+    Most RSS dates are RFC 822, which the stdlib parses far faster than
+    dateutil; dateutil remains the fallback for everything else (ISO 8601 etc.).
+    Cached because the same string is parsed again when ranking by recency.
+    """
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        from dateutil import parser as date_parser
+        try:
+            parsed = date_parser.parse(value)
+        except (ValueError, OverflowError):
+            return None
+    
+    # Normalize to naive UTC (like feedparser's *_parsed dates); strings
+    # without an offset are taken as UTC already
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.replace(tzinfo=None)
+
+
+def _utc_now() -> datetime:
+    """Current time as a naive UTC datetime, comparable with parsed feed dates"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _record_chunks(chunks: Iterable[bytes], sink: List[bytes]) -> Iterator[bytes]:
+    """Pass chunks through unchanged while keeping a copy of each in sink"""
+    for chunk in chunks:
+        sink.append(chunk)
+        yield chunk
+
+
+def _canonical_url(url: str) -> str:
+    """
+    Normalize an article URL for duplicate detection
+    
+    Syndicated and shared copies of a story often differ only by scheme,
+    host case, a www. prefix, a trailing slash, a fragment or tracking
+    parameters; all of those are stripped so the copies compare equal.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode([
+        (name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in TRACKING_PARAMS and not name.lower().startswith(TRACKING_PARAM_PREFIXES)
+    ])
+    return urlunsplit(("", host, parts.path.rstrip("/"), query, ""))
+
+
+@lru_cache(maxsize=32)
+def _criteria_pattern(criteria: str) -> Optional["re.Pattern"]:
+    """
+    One case-insensitive regex matching any comma/semicolon-separated keyword in criteria
+    
+    A single alternation is scanned once per article instead of looping over
+    keywords in Python. Keywords are tried longest first so "GPT-4o" wins
+    over "GPT-4", and lookarounds stand in for \\b so keywords such as "C++"
+    still match on their edges.
+    """
+    keywords = sorted({kw.strip() for kw in re.split(r"[,;]", criteria) if kw.strip()}, key=len, reverse=True)
+    if not keywords:
+        return None
+    return re.compile(
+        r"(?<!\w)(?:" + "|".join(re.escape(keyword) for keyword in keywords) + r")s?(?!\w)",
+        re.IGNORECASE
+    )
+
+
+def _split_chunks(data: bytes, size: int) -> Iterator[bytes]:
+    """Slice an in-memory body into parser-sized chunks"""
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def _local_name(tag: str) -> str:
+    """Element tag without its XML namespace"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _element_text(elem: Optional[ElementTree.Element]) -> Optional[str]:
+    if elem is None or elem.text is None:
+        return None
+    return elem.text.strip()
+
+
+def _entry_from_element(elem: ElementTree.Element) -> Dict[str, Any]:
+    """Map an RSS <item> or Atom <entry> onto the keys feedparser entries expose"""
+    fields = {}
+    for child in elem:
+        name = _local_name(child.tag)
+        # First occurrence wins, as with feedparser
+        if name in fields:
+            continue
+        if name == "link" and child.get("href"):
+            # Atom links carry the URL in href; prefer the alternate (article) link
+            if child.get("rel", "alternate") == "alternate":
+                fields["link"] = child.get("href")
+            continue
+        fields[name] = _element_text(child)
+    
+    entry = {}
+    for key, candidates in (
+        ("title", ("title",)),
+        ("link", ("link",)),
+        ("summary", ("description", "summary", "content", "encoded")),
+        ("published", ("pubDate", "published", "date", "issued")),
+        ("updated", ("updated", "modified")),
+    ):
+        for candidate in candidates:
+            if fields.get(candidate):
+                entry[key] = fields[candidate]
+                break
+    return entry
 
 
 class NewsFetcherAgent(BaseAgent):
@@ -18,7 +199,7 @@ class NewsFetcherAgent(BaseAgent):
     AI_KEYWORDS = [
         'ai', 'artificial intelligence', 'machine learning', 'ml', 'deep learning',
         'neural network', 'llm', 'large language model', 'gpt', 'openai', 'claude',
-        'gemini', 'chatbot', 'generative ai', 'gen ai', 'transformer', 'nlp',
+        'gemini', 'chatgpt', 'chatbot', 'generative ai', 'gen ai', 'transformer', 'nlp',
         'natural language processing', 'computer vision', 'reinforcement learning',
         'ai model', 'ai tool', 'ai research', 'ai ethics', 'agi', 'ai safety',
         'anthropic', 'deepmind', 'hugging face', 'stable diffusion', 'midjourney',
@@ -26,6 +207,24 @@ class NewsFetcherAgent(BaseAgent):
         'ai startup', 'ai investment', 'ai regulation', 'ai policy'
     ]
     
+    # All keywords as one alternation so each article is scanned in a single pass.
+    # Word boundaries stop short keywords like 'ai' matching inside 'said' or 'email';
+    # the optional 's' keeps plurals such as 'LLMs' and 'AI agents'.
+    _AI_REGEX = re.compile(
+        r"\b(?:" + "|".join(re.escape(keyword) for keyword in AI_KEYWORDS) + r")s?\b",
+        re.IGNORECASE
+    )
+    
+    # Structured-output schema for rank/filter replies: 1-based article numbers
+    INDICES_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "indices": {"type": "array", "items": {"type": "integer"}}
+        },
+        "required": ["indices"],
+        "additionalProperties": False
+    }
+    
     def __init__(self):
         super().__init__(
             name="AI News Fetcher",
@@ -38,6 +237,7 @@ class NewsFetcherAgent(BaseAgent):
 5. Return structured data about AI news articles only
 You prioritize credible tech sources and recent AI developments."""
         )
+        self.feed_cache = FeedCache(config.FEED_CACHE_DIRECTORY) if config.FEED_CACHE_ENABLED else None
         
     def _is_ai_related(self, article_data: Dict[str, Any]) -> bool:
         """
@@ -49,23 +249,21 @@ You prioritize credible tech sources and recent AI developments."""
         Returns:
             True if article contains AI-related keywords, False otherwise
         """
-        title = article_data.get('title', '').lower()
-        description = article_data.get('description', '').lower()
+        title = article_data.get('title', '')
+        description = article_data.get('description', '')
         combined_text = f"{title} {description}"
         
-        # Check if any AI keyword appears in the article
-        for keyword in self.AI_KEYWORDS:
-            if keyword in combined_text:
-                return True
-        return False
+        return bool(self._AI_REGEX.search(combined_text))
     
-    def _is_article_recent(self, published_date: str, max_age_days: int = None) -> bool:
+    def _is_article_recent(self, published_date: str, max_age_days: int = None,
+                           published_parsed: Optional[time.struct_time] = None) -> bool:
         """
         Check if an article is recent enough based on publication date
         
         Args:
             published_date: Publication date string
             max_age_days: Maximum age in days (defaults to config value)
+            published_parsed: Date already parsed by feedparser (UTC), used when present
             
         Returns:
             True if article is recent enough, False otherwise
@@ -73,36 +271,32 @@ You prioritize credible tech sources and recent AI developments."""
         if max_age_days is None:
             max_age_days = config.MAX_ARTICLE_AGE_DAYS
         
-        if not published_date or published_date == "Unknown date":
-            # If no date, reject to be safe
-            return False
-        
-        try:
-            # Parse the date string
-            article_date = date_parser.parse(published_date)
-            current_date = datetime.now()
-            
-            # Normalize both to naive datetimes for comparison
-            if article_date.tzinfo is not None:
-                # Convert timezone-aware to naive by removing timezone info
-                article_date = article_date.replace(tzinfo=None)
+        if published_parsed:
+            # feedparser has already done the work; skip string parsing entirely
+            article_date = datetime(*published_parsed[:6])
+        else:
+            if not published_date or published_date == "Unknown date":
+                # If no date, reject to be safe
+                return False
             
-            # Calculate age
-            age = current_date - article_date
-            
-            return age.days <= max_age_days
-        except Exception as e:
-            # If we can't parse the date, reject the article
-            print(f"  [!] Could not parse date '{published_date}': {str(e)}")
-            return False
+            article_date = _parse_published_date(published_date)
+            if article_date is None:
+                # If we can't parse the date, reject the article
+                print(f"  [!] Could not parse date '{published_date}'")
+                return False
+        
+        # Calculate age (both sides naive UTC)
+        age = _utc_now() - article_date
+        
+        return age.days <= max_age_days
     
     def _deduplicate_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Deduplicate articles using local algorithms (no API calls)
         
         Strategy:
-        1. Exact URL matching
-        2. Title similarity (fuzzy matching)
+        1. URL matching (after stripping tracking parameters etc.)
+        2. Title similarity (MinHash/LSH over character 3-grams)
         3. Keep the article with better description/more content
         
         Args:
@@ -111,51 +305,91 @@ You prioritize credible tech sources and recent AI developments."""
         Returns:
             Deduplicated list of articles
         """
-        from difflib import SequenceMatcher
-        
-        def title_similarity(title1: str, title2: str) -> float:
-            """Calculate similarity between two titles (0-1)"""
-            return SequenceMatcher(None, title1.lower(), title2.lower()).ratio()
-        
-        deduplicated = []
+        from datasketch import MinHash, MinHashLSH
+        
+        def title_minhash(title: str) -> MinHash:
+            """MinHash signature over the title's character 3-grams"""
+            text = title.lower()
+            shingles = {text[i:i + 3] for i in range(len(text) - 2)} or {text}
+            minhash = MinHash(num_perm=DEDUP_NUM_PERM)
+            for shingle in shingles:
+                minhash.update(shingle.encode("utf-8"))
+            return minhash
+        
+        # LSH buckets similar signatures together, so each lookup is a hash probe
+        # instead of a comparison against every article kept so far
+        lsh = MinHashLSH(threshold=config.DEDUPLICATION_THRESHOLD, num_perm=DEDUP_NUM_PERM)
+        # Keyed by insert id (also the LSH key); dicts keep insertion order, so
+        # replacing a duplicate in place is O(1) and doesn't reorder the result
+        deduplicated = {}
         seen_urls = set()
         duplicates_removed = 0
         
         print(f"\n[{self.name}] Deduplicating {len(articles)} articles...")
         
         for article in articles:
-            url = article['link']
-            title = article['title']
+            url = _canonical_url(article['link'])
             
-            # Skip exact URL duplicates
+            # Skip URL duplicates
             if url in seen_urls:
                 duplicates_removed += 1
                 continue
             
             # Check for similar titles (likely same story from different sources)
-            is_duplicate = False
-            for existing in deduplicated:
-                similarity = title_similarity(title, existing['title'])
-                
-                # If titles exceed similarity threshold, consider it a duplicate
-                if similarity > config.DEDUPLICATION_THRESHOLD:
-                    duplicates_removed += 1
-                    # Keep the one with more detailed description
-                    if len(article['description']) > len(existing['description']):
-                        # Replace existing with this better version
-                        deduplicated.remove(existing)
-                        deduplicated.append(article)
-                        seen_urls.add(url)
-                    is_duplicate = True
-                    break
+            minhash = title_minhash(article['title'])
+            matches = lsh.query(minhash)
+            if matches:
+                duplicates_removed += 1
+                key = matches[0]
+                # Keep the one with more detailed description
+                if len(article['description']) > len(deduplicated[key]['description']):
+                    # Replace existing with this better version
+                    deduplicated[key] = article
+                    seen_urls.add(url)
+                continue
             
-            if not is_duplicate:
-                deduplicated.append(article)
-                seen_urls.add(url)
+            key = str(len(deduplicated))
+            lsh.insert(key, minhash)
+            deduplicated[key] = article
+            seen_urls.add(url)
         
         print(f"[{self.name}] Removed {duplicates_removed} duplicates, {len(deduplicated)} unique articles remain")
         
-        return deduplicated
+        return list(deduplicated.values())
+    
+    @staticmethod
+    def _select_by_indices(articles: List[Dict[str, Any]], indices: List[int]) -> List[Dict[str, Any]]:
+        """Map 1-based article numbers from the model back to articles, dropping invalid or repeated ones"""
+        selected = []
+        seen = set()
+        for number in indices:
+            i = number - 1
+            if 0 <= i < len(articles) and i not in seen:
+                seen.add(i)
+                selected.append(articles[i])
+        return selected
+    
+    def _local_newsworthiness_score(self, article: Dict[str, Any], now: datetime) -> float:
+        """
+        Zero-cost newsworthiness estimate: recency decay x source authority x keyword density
+        
+        Args:
+            article: Article to score
+            now: Reference time (naive UTC), shared across one ranking pass
+            
+        Returns:
+            Score where higher is more newsworthy; undated articles score 0
+        """
+        published = _parse_published_date(article['published'])
+        if published is None:
+            return 0.0
+        
+        age_hours = max((now - published).total_seconds() / 3600, 0.0)
+        recency = math.exp(-age_hours / RECENCY_DECAY_HOURS)
+        source_weight = config.SOURCE_AUTHORITY.get(article['source'], DEFAULT_SOURCE_AUTHORITY)
+        keyword_hits = len(self._AI_REGEX.findall(f"{article['title']} {article['description']}"))
+        
+        return recency * source_weight * (1 + KEYWORD_HIT_WEIGHT * keyword_hits)
     
     def _rank_articles_efficiently(self, articles: List[Dict[str, Any]], target_count: int) -> List[Dict[str, Any]]:
         """
@@ -163,6 +397,7 @@ You prioritize credible tech sources and recent AI developments."""
         
         Cost optimization:
         - If articles <= target_count: No AI call needed
+        - If LOCAL_RANKING_ONLY: Local newsworthiness heuristic (free)
         - If slightly over: Use recency as tiebreaker (free)
         - If significantly over: One small AI call with compact prompt
         
@@ -177,6 +412,15 @@ You prioritize credible tech sources and recent AI developments."""
             print(f"[{self.name}] {len(articles)} articles within limit, no ranking needed")
             return articles
         
+        if config.LOCAL_RANKING_ONLY:
+            print(f"[{self.name}] Using local newsworthiness scoring (cost-free)")
+            now = _utc_now()
+            return sorted(
+                articles,
+                key=lambda article: self._local_newsworthiness_score(article, now),
+                reverse=True
+            )[:target_count]
+        
         # Only use AI ranking if enabled and we have significantly more than needed
         if not config.SMART_RANKING_ENABLED or len(articles) <= target_count * 1.5:
             # Small overage - just use recency as tiebreaker (cost-free)
@@ -184,11 +428,11 @@ You prioritize credible tech sources and recent AI developments."""
             try:
                 sorted_articles = sorted(
                     articles,
-                    key=lambda x: date_parser.parse(x['published']) if x['published'] != "Unknown date" else datetime.min,
+                    key=lambda x: _parse_published_date(x['published']) or datetime.min,
                     reverse=True
                 )
                 return sorted_articles[:target_count]
-            except:
+            except TypeError:
                 return articles[:target_count]
         
         # Significant overage - use AI but with compact prompt
@@ -200,7 +444,8 @@ You prioritize credible tech sources and recent AI developments."""
             for i, article in enumerate(articles)
         ])
         
-        task = f"""Rank these {len(articles)} AI news articles. Select the top {target_count} most newsworthy.
+        # Static criteria first, per-run numbers and articles last (cache-friendly prefix)
+        task = f"""Rank AI news articles by newsworthiness.
 
 Consider:
 - Breaking news and major announcements
@@ -209,18 +454,14 @@ Consider:
 - Diverse topics (don't pick all from one category)
 - Source credibility and variety
 
-AI Articles:
-{articles_text}
+Return the article numbers of the top {target_count} most newsworthy articles, in order of importance.
 
-Return ONLY the article numbers (comma-separated) of the top {target_count} most newsworthy articles, in order of importance.
-Example format: 1,5,12,3,8,15,22,9,11,19"""
+AI Articles ({len(articles)}):
+{articles_text}"""
         
         try:
-            response = self.execute(task)
-            
-            # Parse the response
-            selected_indices = [int(num.strip()) - 1 for num in response.split(",")]
-            ranked_articles = [articles[i] for i in selected_indices if 0 <= i < len(articles)]
+            response = self.execute_json(task, self.INDICES_SCHEMA, name="rank")
+            ranked_articles = self._select_by_indices(articles, response["indices"])
             
             # Ensure we don't exceed target count
             ranked_articles = ranked_articles[:target_count]
@@ -228,29 +469,157 @@ Example format: 1,5,12,3,8,15,22,9,11,19"""
             print(f"[{self.name}] Selected {len(ranked_articles)} most newsworthy articles")
             return ranked_articles
             
-        except Exception as e:
+        except (ValueError, KeyError) as e:
             print(f"[{self.name}] Ranking failed ({str(e)}), using first {target_count} articles")
             return articles[:target_count]
     
-    def fetch_news(self, max_articles: int = None) -> List[Dict[str, Any]]:
+    def _stream_rss_entries(self, chunks: Iterable[bytes]) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """
-        Fetch AI news with deduplication and cost-efficient ranking
+        Incrementally parse an RSS/Atom feed, yielding one entry at a time
         
-        Optimized collection strategy:
-        1. Collect from ALL sources (ensures diversity)
-        2. Deduplicate locally (no API calls)
-        3. Rank by newsworthiness if needed (minimal API cost)
+        Unlike feedparser, which parses the whole document before returning,
+        this lets the caller stop as soon as it has enough entries. Falls back
+        to feedparser if the XML is malformed or the format unrecognised.
         
         Args:
-            max_articles: Maximum number of articles to fetch
+            chunks: Raw feed bytes, in order
             
-        Returns:
-            List of recent, unique, newsworthy AI articles
+        Yields:
+            Tuples of (feed title, entry dict with feedparser-style keys)
         """
-        if max_articles is None:
-            max_articles = config.MAX_ARTICLES
+        parser = ElementTree.XMLPullParser(events=("start", "end"))
+        consumed = []
+        source_name = "Unknown Source"
+        entry_depth = 0
+        yielded = 0
+        
+        chunks = iter(chunks)
+        try:
+            for chunk in chunks:
+                consumed.append(chunk)
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    tag = _local_name(elem.tag)
+                    if tag in FEED_ENTRY_TAGS:
+                        entry_depth += 1 if event == "start" else -1
+                        if event == "end":
+                            entry = _entry_from_element(elem)
+                            # Drop the finished entry's subtree to keep memory flat
+                            elem.clear()
+                            yielded += 1
+                            yield source_name, entry
+                    elif event == "end" and tag == "title" and entry_depth == 0 and source_name == "Unknown Source":
+                        # Channel/feed title precedes the entries in RSS and Atom
+                        source_name = (elem.text or "").strip() or source_name
+        except ElementTree.ParseError:
+            # feedparser copes with malformed feeds; hand it the whole document,
+            # skipping entries the caller has already seen
+            import feedparser
+            consumed.extend(chunks)
+            feed = feedparser.parse(b"".join(consumed))
+            source_name = feed.feed.get("title", source_name)
+            for entry in feed.entries[yielded:]:
+                yield source_name, entry
+    
+    def _collect_entries(self, chunks: Iterable[bytes]) -> Tuple[str, List[Dict[str, Any]], int, int]:
+        """
+        Parse feed bytes and apply the per-entry filters, stopping at the per-source cap
+        
+        Args:
+            chunks: Raw feed bytes, in order
             
+        Returns:
+            Tuple of (source name, accepted articles, rejected old, rejected non-AI)
+        """
+        source_name = "Unknown Source"
         articles = []
+        rejected_old = 0
+        rejected_non_ai = 0
+        
+        if config.ARTICLES_PER_SOURCE <= 0:
+            return source_name, articles, rejected_old, rejected_non_ai
+        
+        for source_name, entry in self._stream_rss_entries(chunks):
+            published_date = entry.get("published", entry.get("updated", "Unknown date"))
+            
+            # Create article data
+            article = {
+                "title": entry.get("title", "No Title"),
+                "description": entry.get("summary", entry.get("description", "No description available")),
+                "link": entry.get("link", ""),
+                "published": published_date,
+                "source": source_name,
+                "fetched_at": datetime.now().isoformat()
+            }
+            
+            # Keyword check first: one regex pass is far cheaper than date parsing
+            if not self._is_ai_related(article):
+                rejected_non_ai += 1
+                continue
+            
+            # Check if article is recent enough
+            published_parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+            if not self._is_article_recent(published_date, published_parsed=published_parsed):
+                rejected_old += 1
+                continue
+            
+            articles.append(article)
+            # Limit per source (not total) to ensure diversity; stop before
+            # the parser reads and builds another entry
+            if len(articles) >= config.ARTICLES_PER_SOURCE:
+                break
+        
+        return source_name, articles, rejected_old, rejected_non_ai
+    
+    def _fetch_one_feed(self, feed_url: str) -> Tuple[str, List[Dict[str, Any]], int, int]:
+        """
+        Fetch a single feed and apply the per-entry filters
+        
+        Runs inside a worker thread, so it only touches local state and reports
+        its rejection counts back to the caller instead of sharing counters.
+        Unchanged feeds are answered 304 and re-read from the feed cache;
+        feeds whose parsing stopped at the per-source cap are not cached.
+        
+        Args:
+            feed_url: URL of the RSS/Atom feed
+            
+        Returns:
+            Tuple of (source name, accepted articles, rejected old, rejected non-AI)
+        """
+        # Only revalidate when there is a cached body to fall back on
+        cached_body = self.feed_cache.load_body(feed_url) if self.feed_cache else None
+        headers = self.feed_cache.conditional_headers(feed_url) if cached_body is not None else {}
+        
+        # feedparser.parse(url) has no timeout hook, so download with the session first.
+        # Streaming lets us stop parsing as soon as the cap is reached.
+        with _get_session().get(feed_url, headers=headers, timeout=config.FEED_FETCH_TIMEOUT_SECONDS,
+                          stream=True) as response:
+            if response.status_code == 304:
+                return self._collect_entries([cached_body])
+            response.raise_for_status()
+            
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            chunks = response.iter_content(chunk_size=FEED_CHUNK_SIZE)
+            if not self.feed_cache or not (etag or last_modified):
+                # Nothing to revalidate against later; leaving the with-block
+                # closes the connection on the unread remainder
+                return self._collect_entries(chunks)
+            
+            body = []
+            recorded = _record_chunks(chunks, body)
+            result = self._collect_entries(recorded)
+            # Only a fully read body can answer a later 304; when parsing stopped
+            # at the cap, skip caching rather than download the rest
+            if inspect.getgeneratorstate(recorded) == inspect.GEN_CLOSED:
+                try:
+                    self.feed_cache.store(feed_url, etag, last_modified, b"".join(body))
+                except OSError as e:
+                    print(f"  [!] Could not cache {feed_url[:50]}: {str(e)}")
+            return result
+    
+    def _announce_fetch(self) -> List[str]:
+        """Feeds to process this run, after printing the collection plan"""
         feeds = config.NEWS_SOURCES.get("rss_feeds", [])
         
         # Limit number of feeds to process
@@ -263,54 +632,37 @@ Example format: 1,5,12,3,8,15,22,9,11,19"""
         print(f"[{self.name}] Strategy: {articles_per_source} articles per source -> up to {articles_per_source * len(feeds)} total")
         print(f"[{self.name}] Date filter: Last {config.MAX_ARTICLE_AGE_DAYS} days")
         print(f"[{self.name}] AI keyword filter: Active")
+        return feeds
+    
+    def _finish_fetch(self, feeds: List[str], results: Dict[str, Tuple[str, List[Dict[str, Any]], int, int]],
+                      max_articles: Optional[int]) -> List[Dict[str, Any]]:
+        """
+        Merge per-feed results, then deduplicate and rank them
         
+        Args:
+            feeds: Feed URLs in configured order
+            results: Per-feed (source name, articles, rejected old, rejected non-AI)
+            max_articles: Maximum number of articles to return
+            
+        Returns:
+            List of recent, unique, newsworthy AI articles
+        """
+        if max_articles is None:
+            max_articles = config.MAX_ARTICLES
+        
+        if self.feed_cache:
+            self.feed_cache.save()
+        
+        # Merge in configured feed order so results don't depend on which feed answered first
+        articles = []
         rejected_old_articles = 0
         rejected_non_ai_articles = 0
-        
-        # PHASE 1: Collect from all sources (no early termination)
         for feed_url in feeds:
-            try:
-                # Parse feed with timeout
-                feed = feedparser.parse(feed_url)
-                source_name = feed.feed.get("title", "Unknown Source")
-                
-                feed_articles_added = 0
-                
-                for entry in feed.entries:
-                    # Limit per source (not total) to ensure diversity
-                    if feed_articles_added >= articles_per_source:
-                        break
-                    
-                    published_date = entry.get("published", entry.get("updated", "Unknown date"))
-                    
-                    # Check if article is recent enough
-                    if not self._is_article_recent(published_date):
-                        rejected_old_articles += 1
-                        continue
-                    
-                    # Create article data
-                    article = {
-                        "title": entry.get("title", "No Title"),
-                        "description": entry.get("summary", entry.get("description", "No description available")),
-                        "link": entry.get("link", ""),
-                        "published": published_date,
-                        "source": source_name,
-                        "fetched_at": datetime.now().isoformat()
-                    }
-                    
-                    # Check if article is AI-related
-                    if not self._is_ai_related(article):
-                        rejected_non_ai_articles += 1
-                        continue
-                    
-                    articles.append(article)
-                    feed_articles_added += 1
-                    
-                print(f"  [+] {feed_articles_added} articles from {source_name}")
-                
-            except Exception as e:
-                print(f"  [-] Error: {feed_url[:50]}: {str(e)}")
-                continue
+            if feed_url in results:
+                _, feed_articles, old_count, non_ai_count = results[feed_url]
+                articles.extend(feed_articles)
+                rejected_old_articles += old_count
+                rejected_non_ai_articles += non_ai_count
         
         print(f"\n[{self.name}] Collected {len(articles)} AI articles from all sources")
         if rejected_old_articles > 0:
@@ -331,10 +683,145 @@ Example format: 1,5,12,3,8,15,22,9,11,19"""
         
         return articles
     
+    def fetch_news(self, max_articles: int = None) -> List[Dict[str, Any]]:
+        """
+        Fetch AI news with deduplication and cost-efficient ranking
+        
+        Optimized collection strategy:
+        1. Collect from ALL sources concurrently (ensures diversity)
+        2. Deduplicate locally (no API calls)
+        3. Rank by newsworthiness if needed (minimal API cost)
+        
+        Args:
+            max_articles: Maximum number of articles to fetch
+            
+        Returns:
+            List of recent, unique, newsworthy AI articles
+        """
+        feeds = self._announce_fetch()
+        
+        # PHASE 1: Collect from all sources concurrently (feed fetches are IO-bound)
+        results = {}
+        # Not a with-block: its exit joins every worker, so a slow feed would
+        # outlast the timeout below
+        executor = ThreadPoolExecutor(max_workers=min(len(feeds), config.MAX_FEED_WORKERS) or 1)
+        futures = {executor.submit(self._fetch_one_feed, url): url for url in feeds}
+        try:
+            for future in as_completed(futures, timeout=config.FEED_FETCH_TIMEOUT_SECONDS * 2):
+                feed_url = futures[future]
+                try:
+                    results[feed_url] = future.result()
+                except Exception as e:
+                    print(f"  [-] Error: {feed_url[:50]}: {str(e)}")
+                    continue
+                print(f"  [+] {len(results[feed_url][1])} articles from {results[feed_url][0]}")
+        except FuturesTimeoutError:
+            print(f"  [-] Timed out waiting for {len(feeds) - len(results)} feed(s)")
+        finally:
+            # Drop queued feeds and leave stragglers to finish in the background
+            # (cancelled by hand: shutdown's cancel_futures needs Python 3.9)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+        
+        return self._finish_fetch(feeds, results, max_articles)
+    
+    async def _fetch_one_feed_async(self, session: "aiohttp.ClientSession",
+                                    feed_url: str) -> Tuple[str, List[Dict[str, Any]], int, int]:
+        """
+        Async counterpart of _fetch_one_feed()
+        
+        The body is read in full and then parsed in FEED_CHUNK_SIZE pieces, so
+        parsing still stops at the per-source cap.
+        
+        Args:
+            session: Shared aiohttp session
+            feed_url: URL of the RSS/Atom feed
+            
+        Returns:
+            Tuple of (source name, accepted articles, rejected old, rejected non-AI)
+        """
+        import aiohttp
+        
+        # Only revalidate when there is a cached body to fall back on
+        cached_body = self.feed_cache.load_body(feed_url) if self.feed_cache else None
+        headers = self.feed_cache.conditional_headers(feed_url) if cached_body is not None else {}
+        
+        # Same policy as the sync session: retry connection failures with backoff
+        for attempt in range(config.MAX_RETRIES + 1):
+            try:
+                async with session.get(feed_url, headers=headers) as response:
+                    if response.status == 304:
+                        return self._collect_entries([cached_body])
+                    response.raise_for_status()
+                    body = await response.read()
+                break
+            except aiohttp.ClientConnectionError:
+                if attempt == config.MAX_RETRIES:
+                    raise
+                await asyncio.sleep(0.3 * 2 ** attempt)
+        
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.feed_cache and (etag or last_modified):
+            self.feed_cache.store(feed_url, etag, last_modified, body)
+        return self._collect_entries(_split_chunks(body, FEED_CHUNK_SIZE))
+    
+    async def _fetch_and_report(self, session: "aiohttp.ClientSession", feed_url: str,
+                                results: Dict[str, Tuple[str, List[Dict[str, Any]], int, int]]) -> None:
+        """Fetch one feed into results, logging the outcome; one broken feed never fails the rest"""
+        try:
+            results[feed_url] = await self._fetch_one_feed_async(session, feed_url)
+        except Exception as e:
+            print(f"  [-] Error: {feed_url[:50]}: {str(e)}")
+            return
+        print(f"  [+] {len(results[feed_url][1])} articles from {results[feed_url][0]}")
+    
+    async def fetch_news_async(self, max_articles: int = None) -> List[Dict[str, Any]]:
+        """
+        Async counterpart of fetch_news()
+        
+        All feeds share one aiohttp session and connection pool and are
+        fetched on the event loop, so the caller's deadline can cancel them
+        mid-request instead of waiting on worker threads.
+        
+        Args:
+            max_articles: Maximum number of articles to fetch
+            
+        Returns:
+            List of recent, unique, newsworthy AI articles
+        """
+        import aiohttp
+        
+        feeds = self._announce_fetch()
+        
+        # PHASE 1: Collect from all sources concurrently
+        results = {}
+        connector = aiohttp.TCPConnector(limit=FEED_POOL_SIZE)
+        timeout = aiohttp.ClientTimeout(total=config.FEED_FETCH_TIMEOUT_SECONDS)
+        # trust_env: honour HTTP(S)_PROXY like the requests-based sync path does
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, trust_env=True) as session:
+            tasks = [asyncio.ensure_future(self._fetch_and_report(session, url, results)) for url in feeds]
+            if tasks:
+                _, pending = await asyncio.wait(tasks, timeout=config.FEED_FETCH_TIMEOUT_SECONDS * 2)
+                if pending:
+                    print(f"  [-] Timed out waiting for {len(pending)} feed(s)")
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+        
+        # Dedup is CPU work and ranking may block on an API call; keep both off the loop
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._finish_fetch, feeds, results, max_articles
+        )
+    
     def filter_articles(self, articles: List[Dict[str, Any]], criteria: str = None) -> List[Dict[str, Any]]:
         """
         Filter AI articles based on specific criteria using AI
         
+        With config.LOCAL_FILTERING_ONLY the criteria are matched locally as
+        keywords instead; those matches are also the fallback if the API fails.
+        
         Args:
             articles: List of AI articles to filter
             criteria: Filter criteria (e.g., "GPT-4, LLMs, OpenAI")
@@ -345,28 +832,37 @@ Example format: 1,5,12,3,8,15,22,9,11,19"""
         if not criteria or len(articles) <= config.MAX_ARTICLES:
             return articles
         
+        pattern = _criteria_pattern(criteria)
+        keyword_matches = [
+            article for article in articles
+            if pattern and pattern.search(f"{article['title']} {article['description']}")
+        ]
+        if config.LOCAL_FILTERING_ONLY:
+            print(f"\n[{self.name}] Filtered locally to {len(keyword_matches)} articles matching the criteria keywords")
+            return keyword_matches
+        
         # Use AI to filter articles based on criteria
         articles_text = "\n".join([
             f"{i+1}. {article['title']} - {article['source']}"
             for i, article in enumerate(articles)
         ])
         
-        task = f"""Review these AI news articles and select the most relevant ones based on: {criteria}
-        
-AI Articles:
-{articles_text}
+        task = f"""Review these AI news articles and return the article numbers of the most relevant ones.
 
-Return only the article numbers (comma-separated) of the most relevant AI articles."""
-        
-        response = self.execute(task)
+Criteria: {criteria}
+
+AI Articles:
+{articles_text}"""
         
-        # Parse response and filter articles
         try:
-            selected_indices = [int(num.strip()) - 1 for num in response.split(",")]
-            filtered = [articles[i] for i in selected_indices if 0 <= i < len(articles)]
-            print(f"\n[{self.name}] Filtered to {len(filtered)} relevant articles")
-            return filtered
-        except:
-            # If parsing fails, return original articles
-            return articles
+            response = self.execute_json(task, self.INDICES_SCHEMA, name="filter")
+            filtered = self._select_by_indices(articles, response["indices"])
+        except (ValueError, KeyError) as e:
+            # If the call fails, fall back to the keyword matches (or everything if none matched)
+            fallback = keyword_matches or articles
+            print(f"\n[{self.name}] Filtering failed ({str(e)}), keeping {len(fallback)} articles")
+            return fallback
+        
+        print(f"\n[{self.name}] Filtered to {len(filtered)} relevant articles")
+        return filtered
 
@@ -0,0 +1,78 @@
+"""
+Client-side request rate limiting for LLM calls
+"""
+import asyncio
+import threading
+import time
+from typing import Optional
+import config
+
+_LIMITER = None
+_LIMITER_LOCK = threading.Lock()
+
+
+class RateLimiter:
+    """
+    Token bucket: `rate` requests per `period` seconds, bursting up to `rate`
+    
+    Usable from worker threads and coroutines alike. reserve() books the next
+    free slot under a lock and returns how long the caller must wait for it,
+    so sync callers sleep and async callers await on the same schedule.
+    """
+    
+    def __init__(self, rate: float, period: float = 60.0):
+        """
+        Initialize a full bucket
+        
+        Args:
+            rate: Requests allowed per period (also the burst size)
+            period: Length of the period in seconds
+        """
+        self.capacity = rate
+        self.fill_rate = rate / period
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        Take one token
+        
+        Returns:
+            Seconds to wait before sending the request (0 if a token was free)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+            self._updated = now
+            self._tokens -= 1
+            # A negative balance is a booked future slot; wait until it refills
+            return max(0.0, -self._tokens / self.fill_rate)
+    
+    def acquire(self) -> None:
+        """Block the calling thread until a request may be sent"""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+    
+    async def acquire_async(self) -> None:
+        """Wait on the event loop until a request may be sent"""
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Limiter shared by every agent, or None when limiting is disabled
+    
+    The provider's limit is per API key, not per agent, so all agents draw
+    from one bucket.
+    """
+    global _LIMITER
+    if not config.LLM_REQUESTS_PER_MINUTE:
+        return None
+    with _LIMITER_LOCK:
+        if _LIMITER is None:
+            _LIMITER = RateLimiter(config.LLM_REQUESTS_PER_MINUTE, period=60.0)
+    return _LIMITER
@@ -1,14 +1,95 @@
 """
 Summarizer Agent - Responsible for analyzing and summarizing news articles
 """
-from typing import List, Dict, Any
+import asyncio
+import io
+import json
+import os
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
 from .base_agent import BaseAgent
+from .llm_cache import SemanticLLMCache
+from .summary_cache import SummaryCache
 import config
 
 
+# Batch statuses after which polling stops
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """tiktoken encoding for a model (tiktoken is imported on first use)"""
+    import tiktoken
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown or newer model names; o200k_base is the current OpenAI default
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _truncate_to_tokens(text: str, max_tokens: int, model: str) -> str:
+    """Cut text to at most max_tokens tokens of the model's encoding"""
+    # Every token covers at least one byte, so short text can skip tokenizing
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+    encoding = _get_encoding(model)
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens]) + "..."
+
+
+def _load_checkpoint(path: str) -> Dict[str, Dict[str, Any]]:
+    """Summaries saved by an interrupted run, keyed by article link"""
+    done = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    # A crash mid-append can leave a truncated last line
+                    continue
+                if row.get("link") and row.get("ai_summary"):
+                    done[row["link"]] = row
+    except OSError:
+        pass
+    return done
+
+
+def _append_checkpoint(path: str, row: Dict[str, Any]) -> None:
+    """Durably append one summarized article so it survives a crash"""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
 class SummarizerAgent(BaseAgent):
     """Agent specialized in summarizing AI news articles"""
     
+    # Structured reply for multi-article prompts
+    SUMMARIES_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "summaries": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "id": {"type": "integer"},
+                        "summary": {"type": "string"}
+                    },
+                    "required": ["id", "summary"],
+                    "additionalProperties": False
+                }
+            }
+        },
+        "required": ["summaries"],
+        "additionalProperties": False
+    }
+    
     def __init__(self):
         super().__init__(
             name="AI News Summarizer",
@@ -28,30 +109,40 @@ For each article, provide:
 - Key points in bullet format
 - Why this matters for AI (1 sentence impact statement)"""
         )
+        self.semantic_cache = None
+        if config.SEMANTIC_CACHE_ENABLED:
+            self.semantic_cache = SemanticLLMCache(
+                self.client,
+                cache_dir=config.SEMANTIC_CACHE_DIRECTORY,
+                threshold=config.SEMANTIC_CACHE_THRESHOLD,
+                model=config.SEMANTIC_CACHE_EMBEDDING_MODEL,
+                rate_limiter=self.rate_limiter,
+                ttl_days=config.SEMANTIC_CACHE_TTL_DAYS
+            )
+        self.summary_cache = None
+        if config.SUMMARY_CACHE_ENABLED:
+            self.summary_cache = SummaryCache(config.SUMMARY_CACHE_PATH, ttl_days=config.SUMMARY_CACHE_TTL_DAYS)
         
-    def summarize_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _semantic_key(article: Dict[str, Any]) -> str:
         """
-        Summarize a single AI news article
+        Text used for near-duplicate matching
         
-        Args:
-            article: Article dictionary with title, description, etc.
-            
-        Returns:
-            Article with added summary field
+        Only the article content is embedded: the prompt template is identical
+        for every article and would push unrelated stories above the threshold.
         """
-        task = f"""Summarize this AI news article:
-
-Title: {article['title']}
-Source: {article['source']}
-Description: {article['description']}
-
-Provide a {config.SUMMARY_LENGTH} summary including:
+        return f"{article['title']}\n{article['description']}"
+    
+    @staticmethod
+    def _summary_format() -> str:
+        """Per-article summary layout, shared by the single and multi-article prompts"""
+        return f"""Provide a {config.SUMMARY_LENGTH} summary of {{subject}}, including:
 1. Main headline (improve if needed)
 2. Brief summary (2-3 sentences)
 3. Key points (3-5 bullet points)
 4. Impact statement (why this matters)
 
-Format your response as:
+Format {{target}} as:
 HEADLINE: [headline]
 SUMMARY: [summary]
 KEY POINTS:
@@ -59,8 +150,74 @@ KEY POINTS:
 - [point 2]
 - [point 3]
 IMPACT: [impact statement]"""
+    
+    def _article_block(self, article: Dict[str, Any]) -> str:
+        """
+        Article fields for a prompt
+        
+        Some feeds put the full article body in the description; it is cut to
+        config.MAX_ARTICLE_TOKENS, since prefill time and cost grow with input
+        length while a few paragraphs are enough for a short summary.
+        """
+        description = _truncate_to_tokens(article['description'], config.MAX_ARTICLE_TOKENS, self.model)
+        return f"""Title: {article['title']}
+Source: {article['source']}
+Description: {description}"""
+    
+    def _build_summary_task(self, article: Dict[str, Any]) -> str:
+        """
+        Build the summarization prompt shared by the sync, async and batch paths
+        
+        The fixed format instructions come first and the article last, so every
+        request shares the longest possible prefix with the previous one; that
+        prefix is what the API's automatic prompt caching reuses.
+        """
+        instructions = self._summary_format().format(
+            subject="the AI news article below", target="your response"
+        )
+        return f"""{instructions}
+
+Article:
+{self._article_block(article)}"""
+    
+    def _build_multi_summary_task(self, articles: List[Dict[str, Any]]) -> str:
+        """Prompt summarizing several articles at once; articles are numbered from 1"""
+        instructions = self._summary_format().format(
+            subject="each AI news article below", target="each summary"
+        )
+        articles_text = "\n\n".join(
+            f"Article {i}:\n{self._article_block(article)}"
+            for i, article in enumerate(articles, 1)
+        )
+        return f"""{instructions}
+
+Return one entry per article, with "id" set to the article's number.
+
+{articles_text}"""
+    
+    def summarize_article(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Summarize a single AI news article
+        
+        Args:
+            article: Article dictionary with title, description, etc.
+            
+        Returns:
+            Article with added summary field
+        """
+        summary = None
+        if self.summary_cache is not None and article['link']:
+            summary = self.summary_cache.get(article)
+        if summary is None and self.semantic_cache is not None:
+            summary = self.semantic_cache.get(self._semantic_key(article))
         
-        summary = self.execute(task)
+        if summary is None:
+            summary = self.execute(self._build_summary_task(article), max_tokens=config.SUMMARY_MAX_TOKENS)
+            if self.semantic_cache is not None and not self.is_error_response(summary):
+                self.semantic_cache.set(self._semantic_key(article), summary)
+                self.semantic_cache.flush()
+            if self.summary_cache is not None and article['link'] and not self.is_error_response(summary):
+                self.summary_cache.put(article, summary)
         
         # Parse the summary
         article_summary = {
@@ -70,54 +227,424 @@ IMPACT: [impact statement]"""
         
         return article_summary
     
-    def summarize_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _summarize_article_async(self, article: Dict[str, Any], sem: asyncio.Semaphore) -> Dict[str, Any]:
+        """Summarize one article, holding the semaphore only for the API round-trip"""
+        loop = asyncio.get_running_loop()
+        summary = None
+        if self.semantic_cache is not None:
+            summary = await loop.run_in_executor(None, self.semantic_cache.get, self._semantic_key(article))
+        
+        if summary is None:
+            async with sem:
+                summary = await self.aexecute(self._build_summary_task(article),
+                                              max_tokens=config.SUMMARY_MAX_TOKENS)
+            if self.semantic_cache is not None and not self.is_error_response(summary):
+                await loop.run_in_executor(None, self.semantic_cache.set, self._semantic_key(article), summary)
+        
+        return {
+            **article,
+            "ai_summary": summary
+        }
+    
+    async def _summarize_rows_async(self, articles: List[Dict[str, Any]],
+                                    sem: asyncio.Semaphore) -> Dict[int, str]:
+        """
+        Summarize several articles in a single request
+        
+        One prompt for K articles pays the network round-trip and the shared
+        instruction prefill once instead of K times, and counts as a single
+        request against the provider's RPM limit.
+        
+        Returns:
+            Summaries keyed by position in `articles`; articles the model
+            skipped (or all of them, if the call failed) are missing
+        """
+        try:
+            async with sem:
+                response = await self.aexecute_json(
+                    self._build_multi_summary_task(articles), self.SUMMARIES_SCHEMA, name="summaries",
+                    max_tokens=config.SUMMARY_MAX_TOKENS * len(articles)
+                )
+        except ValueError as e:
+            print(f"  [-] Multi-article summary failed, retrying articles one by one: {str(e)}")
+            return {}
+        
+        return {
+            row["id"] - 1: row["summary"]
+            for row in response["summaries"]
+            if 1 <= row["id"] <= len(articles) and not self.is_error_response(row["summary"])
+        }
+    
+    async def _summarize_chunk_async(self, chunk: List[Dict[str, Any]],
+                                     sem: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """Summarize a chunk of articles, falling back to one request per article it couldn't answer"""
+        if len(chunk) == 1:
+            return [await self._summarize_article_async(chunk[0], sem)]
+        
+        loop = asyncio.get_running_loop()
+        summaries = {}
+        if self.semantic_cache is not None:
+            for i, article in enumerate(chunk):
+                hit = await loop.run_in_executor(None, self.semantic_cache.get, self._semantic_key(article))
+                if hit is not None:
+                    summaries[i] = hit
+        
+        misses = [i for i in range(len(chunk)) if i not in summaries]
+        if len(misses) > 1:
+            rows = await self._summarize_rows_async([chunk[i] for i in misses], sem)
+            for n, i in enumerate(misses):
+                if n in rows:
+                    summaries[i] = rows[n]
+                    if self.semantic_cache is not None:
+                        await loop.run_in_executor(None, self.semantic_cache.set,
+                                                   self._semantic_key(chunk[i]), rows[n])
+        
+        results = []
+        for i, article in enumerate(chunk):
+            if i in summaries:
+                results.append({**article, "ai_summary": summaries[i]})
+            else:
+                results.append(await self._summarize_article_async(article, sem))
+        return results
+    
+    async def _summarize_and_checkpoint(self, chunk: List[Dict[str, Any]], sem: asyncio.Semaphore,
+                                        checkpoint_path: Optional[str]) -> List[Dict[str, Any]]:
+        """Summarize a chunk and record each article in the checkpoint as soon as it succeeds"""
+        results = await self._summarize_chunk_async(chunk, sem)
+        for result in results:
+            self._record_summary(result, checkpoint_path)
+        return results
+    
+    def _record_summary(self, result: Dict[str, Any], checkpoint_path: Optional[str]) -> None:
+        """Save a finished summary to the checkpoint and the summary cache"""
+        if not result['link'] or self.is_error_response(result['ai_summary']):
+            return
+        if checkpoint_path:
+            _append_checkpoint(checkpoint_path, result)
+        if self.summary_cache is not None:
+            self.summary_cache.put(result, result['ai_summary'])
+    
+    def _known_summaries(self, articles: List[Dict[str, Any]],
+                         checkpoint_path: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Summaries that need no API call, keyed by article link
+        
+        Articles in the checkpoint file (from an interrupted run) or in the
+        summary cache (from an earlier run) are not summarized again.
+        """
+        done = _load_checkpoint(checkpoint_path) if checkpoint_path else {}
+        resumed = sum(article['link'] in done for article in articles)
+        if resumed:
+            print(f"  [+] Resuming: {resumed} summaries loaded from {checkpoint_path}")
+        
+        if self.summary_cache is not None:
+            cached = 0
+            for article in articles:
+                summary = self.summary_cache.get(article) if article['link'] not in done else None
+                if summary is not None:
+                    done[article['link']] = {"ai_summary": summary}
+                    cached += 1
+            if cached:
+                print(f"  [+] {cached} summaries reused from earlier runs")
+        
+        return done
+    
+    async def _gather(self, articles: List[Dict[str, Any]],
+                      checkpoint_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Run all summarizations concurrently, bounded by config.SUMMARY_CONCURRENCY
+        
+        Pending articles are sent config.SUMMARY_ROWS_PER_REQUEST at a time;
+        checkpointed and cached summaries are reused. Once every article has a
+        summary the checkpoint is removed, so the next run starts clean.
+        """
+        done = self._known_summaries(articles, checkpoint_path)
+        pending = [article for article in articles if article['link'] not in done]
+        
+        rows = max(1, config.SUMMARY_ROWS_PER_REQUEST)
+        chunks = [pending[i:i + rows] for i in range(0, len(pending), rows)]
+        sem = asyncio.Semaphore(config.SUMMARY_CONCURRENCY)
+        chunk_results = await asyncio.gather(
+            *[self._summarize_and_checkpoint(chunk, sem, checkpoint_path) for chunk in chunks],
+            return_exceptions=True
+        )
+        
+        flat_results = []
+        for chunk, result in zip(chunks, chunk_results):
+            # A failed chunk counts as a failure for each of its articles
+            flat_results.extend([result] * len(chunk) if isinstance(result, Exception) else result)
+        results = iter(flat_results)
+        
+        summarized_articles = []
+        complete = True
+        for article in articles:
+            if article['link'] in done:
+                summarized_articles.append({**article, "ai_summary": done[article['link']]["ai_summary"]})
+                continue
+            
+            result = next(results)
+            if isinstance(result, Exception):
+                print(f"  [-] Error summarizing article '{article['title'][:50]}': {str(result)}")
+                # Keep original article without summary
+                summarized_articles.append(article)
+                complete = False
+            else:
+                summarized_articles.append(result)
+                complete = complete and not self.is_error_response(result['ai_summary'])
+        
+        if checkpoint_path and complete and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        
+        return summarized_articles
+    
+    def completed_summaries(self, articles: List[Dict[str, Any]],
+                            checkpoint_path: Optional[str] = None) -> List[Dict[str, Any]]:
         """
-        Summarize multiple articles
+        Articles that already have a summary on disk, without calling the API
+        
+        Lets a caller salvage what an interrupted run finished: the checkpoint
+        holds this run's summaries and the summary cache earlier runs'.
+        
+        Args:
+            articles: Articles being summarized
+            checkpoint_path: JSONL progress file (defaults to config.SUMMARY_CHECKPOINT_PATH)
+            
+        Returns:
+            The summarized subset of articles, in the original order
+        """
+        done = _load_checkpoint(checkpoint_path or config.SUMMARY_CHECKPOINT_PATH)
+        completed = []
+        for article in articles:
+            summary = done[article['link']]["ai_summary"] if article['link'] in done else None
+            if summary is None and self.summary_cache is not None and article['link']:
+                summary = self.summary_cache.get(article)
+            if summary is not None:
+                completed.append({**article, "ai_summary": summary})
+        return completed
+    
+    async def summarize_articles_batch_async(self, articles: List[Dict[str, Any]],
+                                             checkpoint_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Summarize articles through the OpenAI Batch API
+        
+        Batch jobs are billed at half the real-time token price but may take up
+        to 24h, which suits scheduled digest runs where nobody waits on the result.
+        Only articles missing from the checkpoint and the summary cache are
+        submitted, and the batch results are saved to both. Cancelling this
+        coroutine (e.g. at the workflow deadline) also cancels the remote batch.
         
         Args:
             articles: List of articles to summarize
+            checkpoint_path: JSONL progress file for resuming an interrupted run
             
         Returns:
-            List of articles with summaries
+            List of articles with summaries; articles the batch did not answer
+            are returned unchanged
         """
-        print(f"\n[{self.name}] Summarizing {len(articles)} articles...")
+        done = self._known_summaries(articles, checkpoint_path)
+        pending = [article for article in articles if article['link'] not in done]
+        summaries = await self._run_batch_async(pending) if pending else {}
         
         summarized_articles = []
-        for i, article in enumerate(articles, 1):
-            print(f"  Processing article {i}/{len(articles)}: {article['title'][:50]}...")
-            try:
-                summarized = self.summarize_article(article)
-                summarized_articles.append(summarized)
-            except Exception as e:
-                print(f"  [-] Error summarizing article: {str(e)}")
-                # Keep original article without summary
+        complete = True
+        pending_index = 0
+        for article in articles:
+            if article['link'] in done:
+                summarized_articles.append({**article, "ai_summary": done[article['link']]["ai_summary"]})
+                continue
+            
+            summary = summaries.get(f"art-{pending_index}")
+            pending_index += 1
+            if summary is None:
+                print(f"  [-] No batch result for article: {article['title'][:50]}")
                 summarized_articles.append(article)
+                complete = False
+            else:
+                result = {**article, "ai_summary": summary}
+                self._record_summary(result, checkpoint_path)
+                summarized_articles.append(result)
+        
+        if checkpoint_path and complete and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
         
-        print(f"\n[{self.name}] Completed summarization of {len(summarized_articles)} articles")
         return summarized_articles
     
-    def identify_themes(self, articles: List[Dict[str, Any]]) -> List[str]:
+    async def _run_batch_async(self, articles: List[Dict[str, Any]]) -> Dict[str, str]:
         """
-        Identify common themes across multiple AI articles
+        Submit one summary request per article as a batch job and wait for it
         
         Args:
-            articles: List of summarized AI articles
+            articles: Articles to summarize
+            
+        Returns:
+            Summaries keyed by custom_id ("art-<index>"); empty if the batch failed
+        """
+        lines = []
+        for i, article in enumerate(articles):
+            lines.append(json.dumps({
+                "custom_id": f"art-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": self._build_messages(self._build_summary_task(article)),
+                    "temperature": self.temperature,
+                    "max_tokens": config.SUMMARY_MAX_TOKENS
+                }
+            }))
+        jsonl_bytes = ("\n".join(lines) + "\n").encode("utf-8")
+        
+        from openai import OpenAIError
+        
+        client = self.async_client
+        input_file = await client.files.create(file=io.BytesIO(jsonl_bytes), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"[{self.name}] Submitted batch {batch.id} with {len(articles)} requests")
+        
+        try:
+            while batch.status not in BATCH_TERMINAL_STATUSES:
+                await asyncio.sleep(config.BATCH_POLL_INTERVAL_SECONDS)
+                batch = await client.batches.retrieve(batch.id)
+                print(f"  Batch {batch.id}: {batch.status}")
+        except asyncio.CancelledError:
+            # Nobody will collect the results, so don't leave the job running (and billed)
+            print(f"  [!] Cancelling batch {batch.id}")
+            try:
+                await client.batches.cancel(batch.id)
+            except OpenAIError as e:
+                print(f"  [-] Could not cancel batch {batch.id}: {str(e)}")
+            raise
+        
+        if batch.status != "completed" or not batch.output_file_id:
+            print(f"  [-] Batch {batch.id} ended with status '{batch.status}', keeping original articles")
+            return {}
+        
+        summaries = {}
+        output = await client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            response = row.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            summaries[row["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        
+        return summaries
+    
+    def summarize_articles(self, articles: List[Dict[str, Any]],
+                           checkpoint_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Summarize multiple articles concurrently
+        
+        Sync wrapper around summarize_articles_async() for callers that don't
+        run an event loop of their own.
+        
+        Args:
+            articles: List of articles to summarize
+            checkpoint_path: JSONL progress file for resuming an interrupted run
+                (defaults to config.SUMMARY_CHECKPOINT_PATH)
+            
+        Returns:
+            List of articles with summaries, in the original order
+        """
+        return asyncio.run(self._summarize_articles_and_close(articles, checkpoint_path))
+    
+    async def _summarize_articles_and_close(self, articles: List[Dict[str, Any]],
+                                            checkpoint_path: Optional[str]) -> List[Dict[str, Any]]:
+        """Run summarize_articles_async() and close the async client before the loop ends"""
+        try:
+            return await self.summarize_articles_async(articles, checkpoint_path)
+        finally:
+            await self.aclose()
+    
+    async def summarize_articles_async(self, articles: List[Dict[str, Any]],
+                                       checkpoint_path: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Summarize multiple articles concurrently
+        
+        Each summary is an independent API call, so they are issued in parallel
+        rather than paying one full round-trip per article. With
+        config.USE_BATCH_API the calls go through the Batch API instead.
+        
+        Args:
+            articles: List of articles to summarize
+            checkpoint_path: JSONL progress file for resuming an interrupted run
+                (defaults to config.SUMMARY_CHECKPOINT_PATH)
             
         Returns:
-            List of identified AI themes
+            List of articles with summaries, in the original order
+        """
+        if config.USE_BATCH_API:
+            print(f"\n[{self.name}] Summarizing {len(articles)} articles via the Batch API...")
+            summarized_articles = await self.summarize_articles_batch_async(
+                articles, checkpoint_path or config.SUMMARY_CHECKPOINT_PATH
+            )
+        else:
+            print(f"\n[{self.name}] Summarizing {len(articles)} articles "
+                  f"(up to {config.SUMMARY_CONCURRENCY} concurrent requests)...")
+            try:
+                summarized_articles = await self._gather(
+                    articles, checkpoint_path or config.SUMMARY_CHECKPOINT_PATH
+                )
+            finally:
+                # One write per run, and still saved when the run is cut short
+                if self.semantic_cache is not None:
+                    self.semantic_cache.flush()
+        
+        print(f"\n[{self.name}] Completed summarization of {len(summarized_articles)} articles")
+        return summarized_articles
+    
+    def _build_themes_task(self, articles: List[Dict[str, Any]]) -> str:
+        """
+        Theme prompt; uses each article's summary when available, else its description
+        
+        Each text is capped at config.THEME_ARTICLE_TOKENS: a few sentences per
+        article are enough to spot trends, and the prompt grows with every article.
         """
         articles_text = "\n\n".join([
-            f"Article {i+1}: {article['title']}\n{article.get('ai_summary', article['description'])}"
+            f"Article {i+1}: {article['title']}\n"
+            f"{_truncate_to_tokens(article.get('ai_summary', article['description']), config.THEME_ARTICLE_TOKENS, self.model)}"
             for i, article in enumerate(articles)
         ])
         
-        task = f"""Analyze these AI news articles and identify 3-5 major AI themes or trends:
+        return f"""Analyze these AI news articles and identify 3-5 major AI themes or trends:
 
 {articles_text}
 
 List the themes as bullet points with brief explanations."""
+    
+    def identify_themes(self, articles: List[Dict[str, Any]]) -> str:
+        """
+        Identify common themes across multiple AI articles
         
-        themes_response = self.execute(task)
+        Args:
+            articles: List of summarized AI articles
+            
+        Returns:
+            Identified AI themes as a bullet list, or "" when there are fewer
+            than config.MIN_ARTICLES_FOR_THEMES articles
+        """
+        if len(articles) < config.MIN_ARTICLES_FOR_THEMES:
+            return ""
+        return self.execute(self._build_themes_task(articles))
+    
+    async def identify_themes_async(self, articles: List[Dict[str, Any]]) -> str:
+        """
+        Async counterpart of identify_themes()
         
-        return themes_response
-
+        Args:
+            articles: List of AI articles (summarized or not)
+            
+        Returns:
+            Identified AI themes as a bullet list, or "" when there are fewer
+            than config.MIN_ARTICLES_FOR_THEMES articles
+        """
+        # A handful of stories has no meaningful "themes"; skip the round-trip
+        if len(articles) < config.MIN_ARTICLES_FOR_THEMES:
+            return ""
+        return await self.aexecute(self._build_themes_task(articles))
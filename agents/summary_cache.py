@@ -0,0 +1,81 @@
+"""
+Persistent cache of article summaries (SQLite)
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+class SummaryCache:
+    """Maps an article's identity to its finished summary across runs"""
+    
+    def __init__(self, db_path: str = ".summary_cache.sqlite3", ttl_days: Optional[float] = None):
+        """
+        Open (or create) the cache database
+        
+        Args:
+            db_path: SQLite file holding the summaries
+            ttl_days: Maximum age of a summary, or None to keep entries forever
+        """
+        self.ttl_seconds = ttl_days * 86400 if ttl_days is not None else None
+        # Used from the event loop and from executor threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries (hash TEXT PRIMARY KEY, summary TEXT, ts REAL)"
+            )
+    
+    @staticmethod
+    def make_key(article: Dict[str, Any]) -> str:
+        """
+        Stable key for an article
+        
+        The title and publication date are included with the URL so that a
+        story republished under the same link with new content is summarized
+        again.
+        """
+        text = "\n".join([
+            article.get("link") or "",
+            article.get("title") or "",
+            article.get("published") or ""
+        ])
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    
+    def get(self, article: Dict[str, Any]) -> Optional[str]:
+        """
+        Look up an article's summary
+        
+        Args:
+            article: Article dictionary with link, title and published date
+        
+        Returns:
+            The cached summary, or None on a miss or an expired entry
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT summary, ts FROM summaries WHERE hash = ?", (self.make_key(article),)
+            ).fetchone()
+        if row is None:
+            return None
+        
+        summary, ts = row
+        if self.ttl_seconds is not None and time.time() - ts > self.ttl_seconds:
+            return None
+        return summary
+    
+    def put(self, article: Dict[str, Any], summary: str) -> None:
+        """
+        Store an article's summary
+        
+        Args:
+            article: Article dictionary with link, title and published date
+            summary: The finished summary
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (hash, summary, ts) VALUES (?, ?, ?)",
+                (self.make_key(article), summary, time.time())
+            )
@@ -0,0 +1,51 @@
+"""
+Command-line arguments shared by main.py and orchestrator.py
+"""
+import argparse
+from dataclasses import dataclass
+from typing import List, Optional
+import config
+
+
+@dataclass
+class RunConfig:
+    """Options for one workflow run"""
+    max_articles: Optional[int] = None
+    filter_criteria: Optional[str] = None
+    interactive: bool = False
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser for the AI news workflow"""
+    parser = argparse.ArgumentParser(description="AI News Researcher Agent - multi-agent AI news digest")
+    parser.add_argument(
+        "-i", "--interactive", action="store_true",
+        help="prompt for options (only when attached to a terminal)"
+    )
+    parser.add_argument(
+        "-n", "--max-articles", type=int, default=None,
+        help=f"maximum number of AI articles to process (default {config.MAX_ARTICLES})"
+    )
+    parser.add_argument(
+        "-f", "--filter", dest="filter_criteria", default=None,
+        help="criteria to filter AI articles, e.g. 'GPT-4, LLMs, OpenAI'"
+    )
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> RunConfig:
+    """
+    Parse command-line arguments
+    
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+    
+    Returns:
+        The run options
+    """
+    args = build_parser().parse_args(argv)
+    return RunConfig(
+        max_articles=args.max_articles,
+        filter_criteria=args.filter_criteria,
+        interactive=args.interactive
+    )
@@ -20,6 +20,7 @@ load_dotenv()
 # OpenAI Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = "gpt-4o-mini"  # Using the latest efficient model
+OPENAI_TEMPERATURE = 0.7  # Sampling temperature for all agent calls
 
 # News Sources Configuration - AI-Focused
 NEWS_SOURCES = {
@@ -41,13 +42,30 @@ NEWS_SOURCES = {
 # Agent Configuration - AI News Only
 MAX_ARTICLES = 10  # Maximum number of AI articles to process
 SUMMARY_LENGTH = "concise"  # Options: "concise", "detailed", "brief"
-DIGEST_FORMAT = "markdown"  # Options: "markdown", "html", "plain"
+MAX_ARTICLE_TOKENS = 1000  # Article descriptions longer than this are truncated before summarizing
+SUMMARY_MAX_TOKENS = 400  # Response token cap per summarized article
+MIN_ARTICLES_FOR_THEMES = 5  # Skip theme identification (one LLM call) for fewer articles
+THEME_ARTICLE_TOKENS = 200  # Per-article text cap in the theme identification prompt
+DIGEST_FORMAT = "markdown"  # Options: "markdown", "html", "plain" (LLM compilation only)
+USE_LLM_COMPILATION = False  # Compile the digest with an extra LLM call instead of locally
 
 # Article Collection Strategy
 # Ensures diversity across sources and prevents first source from dominating
 ARTICLES_PER_SOURCE = 5  # Collect this many from each source before ranking
-DEDUPLICATION_THRESHOLD = 0.85  # Title similarity threshold for duplicates (0-1)
+DEDUPLICATION_THRESHOLD = 0.85  # Title Jaccard similarity (3-grams) threshold for duplicates (0-1)
 SMART_RANKING_ENABLED = True  # Use AI ranking when articles exceed threshold
+LOCAL_RANKING_ONLY = False  # Rank by recency x SOURCE_AUTHORITY x keyword hits (free) instead of recency or the API
+LOCAL_FILTERING_ONLY = False  # Match filter criteria as comma-separated keywords, never the API
+
+# Source authority weights for local ranking (0-1), keyed by feed title
+# Unlisted sources get 0.5
+SOURCE_AUTHORITY = {
+    "AI News & Artificial Intelligence | TechCrunch": 1.0,
+    "AI | VentureBeat": 0.9,
+    "The Verge": 0.9,
+    "AI News": 0.7,
+    "MarkTechPost": 0.7,
+}
 
 # AI Keyword Filtering
 # Articles must contain AI-related keywords to be included
@@ -58,8 +76,43 @@ MAX_ARTICLE_AGE_DAYS = 7  # Only process AI articles from the last 7 days
 MAX_EXECUTION_TIME_SECONDS = 300  # Maximum 5 minutes total execution time
 MAX_FEEDS_TO_PROCESS = 5  # Limit number of AI RSS feeds to process
 FEED_FETCH_TIMEOUT_SECONDS = 10  # Timeout for each feed fetch
+MAX_FEED_WORKERS = 8  # Upper bound on feeds fetched in parallel
+FEED_CACHE_ENABLED = True  # Conditional GETs (ETag / Last-Modified) for unchanged feeds
+FEED_CACHE_DIRECTORY = ".feed_cache"
 API_CALL_TIMEOUT_SECONDS = 30  # Timeout for each OpenAI API call
+SUMMARY_CONCURRENCY = 8  # Maximum summarization requests in flight at once
+SUMMARY_ROWS_PER_REQUEST = 5  # Articles packed into one summarization prompt (3-8 works well, 1 disables)
+SUMMARY_CHECKPOINT_PATH = ".summary_checkpoint.jsonl"  # Lets a failed run resume summarization
 MAX_RETRIES = 2  # Maximum retries for failed operations
+LLM_MAX_RETRIES = 3  # OpenAI SDK retries with exponential backoff (429s, timeouts, 5xx)
+LLM_REQUESTS_PER_MINUTE = 500  # Client-side cap shared by all agents; match your OpenAI tier (0 disables)
+
+# Batch API (50% cheaper, up to 24h turnaround)
+# Only worth enabling for unattended runs with MAX_EXECUTION_TIME_SECONDS raised to
+# cover the turnaround: a batch still running at the deadline is cancelled
+USE_BATCH_API = False  # Summarize through the OpenAI Batch API instead of live calls
+BATCH_POLL_INTERVAL_SECONDS = 30  # How often to check batch status
+
+# LLM Response Cache
+# Identical prompts (same model, messages and temperature) are answered from disk
+LLM_CACHE_ENABLED = True  # Cache responses under LLM_CACHE_DIRECTORY
+LLM_CACHE_DIRECTORY = ".llm_cache"
+LLM_CACHE_TTL_DAYS = 7  # Cached responses older than this are refetched
+LLM_CACHE_NONDETERMINISTIC = False  # Also cache sampled (temperature > 0) responses
+
+# Semantic Summary Cache
+# Reuses a summary when another source republishes a near-identical article
+SEMANTIC_CACHE_ENABLED = False  # Costs one embedding call per article
+SEMANTIC_CACHE_DIRECTORY = ".llm_cache/semantic"
+SEMANTIC_CACHE_THRESHOLD = 0.92  # Minimum cosine similarity to reuse a summary (0-1)
+SEMANTIC_CACHE_EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_CACHE_TTL_DAYS = 30  # Cached summaries older than this are ignored and pruned
+
+# Summary Cache
+# Articles seen in an earlier run (same link, title and date) reuse their summary
+SUMMARY_CACHE_ENABLED = True  # Store finished summaries in SUMMARY_CACHE_PATH
+SUMMARY_CACHE_PATH = ".summary_cache.sqlite3"
+SUMMARY_CACHE_TTL_DAYS = 30  # Summaries older than this are regenerated
 
 # Output Configuration
 OUTPUT_DIRECTORY = "ai_news_digests"
@@ -1,14 +1,14 @@
 """
 Example usage of the AI News Researcher Agent
 """
-from orchestrator import NewsResearchOrchestrator
+from orchestrator import get_orchestrator
 
 
 def example_basic():
     """Example: Basic usage with defaults - fetches latest AI news"""
     print("Example 1: Basic AI News Fetch\n" + "="*50)
     
-    orchestrator = NewsResearchOrchestrator()
+    orchestrator = get_orchestrator()
     digest_path = orchestrator.run()
     
     print(f"\nAI News Digest saved to: {digest_path}")
@@ -18,7 +18,7 @@ def example_custom():
     """Example: Custom parameters for specific AI topics"""
     print("\n\nExample 2: Custom AI Topics\n" + "="*50)
     
-    orchestrator = NewsResearchOrchestrator()
+    orchestrator = get_orchestrator()
     digest_path = orchestrator.run(
         max_articles=5,
         filter_criteria="GPT-4, Large Language Models, OpenAI"
@@ -31,12 +31,11 @@ def example_programmatic():
     """Example: Programmatic usage with custom AI news workflow"""
     print("\n\nExample 3: Custom AI News Workflow\n" + "="*50)
     
-    from agents import NewsFetcherAgent, SummarizerAgent, DigestCompilerAgent
-    
-    # Create individual AI news agents
-    fetcher = NewsFetcherAgent()
-    summarizer = SummarizerAgent()
-    compiler = DigestCompilerAgent()
+    # Use the individual AI news agents (shared with the other examples)
+    orchestrator = get_orchestrator()
+    fetcher = orchestrator.fetcher
+    summarizer = orchestrator.summarizer
+    compiler = orchestrator.compiler
     
     # Step-by-step AI news workflow
     print("\n1. Fetching AI news...")
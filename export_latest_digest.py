@@ -8,7 +8,9 @@ from __future__ import annotations
 
 from pathlib import Path
 from datetime import datetime
-import json
+import os
+
+import orjson
 
 
 DIGEST_DIR = Path("ai_news_digests")
@@ -19,24 +21,32 @@ def main() -> None:
     """Export the latest markdown digest as a JSON payload."""
     DIGEST_DIR.mkdir(exist_ok=True)
 
-    digest_files = sorted(DIGEST_DIR.glob("ai_news_digest_*.md"), reverse=True)
-    if not digest_files:
+    # Filenames embed a sortable timestamp, so the newest is the largest
+    # name: a single pass with no sort and no stat() calls. scandir yields
+    # plain directory entries, skipping glob's pattern matching and
+    # per-entry Path objects.
+    with os.scandir(DIGEST_DIR) as entries:
+        latest = max(
+            (entry.name for entry in entries
+             if entry.name.startswith("ai_news_digest_") and entry.name.endswith(".md")),
+            default=None,
+        )
+    if latest is None:
         raise SystemExit("No digest files found in ai_news_digests/")
 
-    latest = digest_files[0]
-    markdown_text = latest.read_text(encoding="utf-8")
+    markdown_text = (DIGEST_DIR / latest).read_text(encoding="utf-8")
 
     payload = {
-        "filename": latest.name,
+        "filename": latest,
         "generated_at": datetime.now().isoformat(),
         "markdown": markdown_text,
     }
 
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    # orjson serializes straight to UTF-8 bytes (same layout as
+    # json.dumps(..., ensure_ascii=False, indent=2)), so there is no separate
+    # encode step and the file is written in a single call
+    OUTPUT_PATH.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
 
 if __name__ == "__main__":
@@ -2,12 +2,15 @@
 Main entry point for AI News Researcher Agent
 """
 from orchestrator import NewsResearchOrchestrator
+from cli import parse_args
 import config
 import sys
 
 
 def main():
     """Main function to run the AI News Researcher Agent"""
+    # Parse arguments first so --help works without an API key
+    run_config = parse_args()
     
     # Check if OpenAI API key is configured
     if not config.OPENAI_API_KEY:
@@ -25,11 +28,10 @@ def main():
     orchestrator = NewsResearchOrchestrator()
     
     # Check if interactive mode is requested
-    if "--interactive" in sys.argv or "-i" in sys.argv:
-        orchestrator.run_interactive()
+    if run_config.interactive:
+        orchestrator.run_interactive(run_config)
     else:
-        # Run with default configuration
-        orchestrator.run()
+        orchestrator.run(max_articles=run_config.max_articles, filter_criteria=run_config.filter_criteria)
 
 
 if __name__ == "__main__":
@@ -2,34 +2,71 @@
 Orchestrator - Coordinates all agents in the news research system
 """
 from agents import NewsFetcherAgent, SummarizerAgent, DigestCompilerAgent
+from cli import RunConfig, parse_args
 import config
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from datetime import datetime
+from functools import lru_cache
+import asyncio
+import sys
 import time
 
 
+def _print_block(*lines: str) -> None:
+    """
+    Print several lines with a single write
+    
+    Multi-line banners otherwise cost one write (and one stdout lock) per
+    line; under CI each of those is a separate chunk in the streamed log.
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
 class NewsResearchOrchestrator:
     """Main orchestrator that coordinates all agents"""
     
     def __init__(self):
         """Initialize all agents"""
-        print("\n" + "="*70)
-        print("AI NEWS RESEARCHER AGENT - Multi-Agent System")
-        print("Focused exclusively on AI, ML, and AI Research news")
-        print("="*70)
+        _print_block(
+            "\n" + "="*70,
+            "AI NEWS RESEARCHER AGENT - Multi-Agent System",
+            "Focused exclusively on AI, ML, and AI Research news",
+            "="*70
+        )
         
         self.fetcher = NewsFetcherAgent()
         self.summarizer = SummarizerAgent()
         self.compiler = DigestCompilerAgent()
         
-        print(f"\n[+] Initialized {self.fetcher}")
-        print(f"[+] Initialized {self.summarizer}")
-        print(f"[+] Initialized {self.compiler}")
+        _print_block(
+            f"\n[+] Initialized {self.fetcher}",
+            f"[+] Initialized {self.summarizer}",
+            f"[+] Initialized {self.compiler}"
+        )
         
     def run(self, max_articles: Optional[int] = None, filter_criteria: Optional[str] = None) -> str:
         """
         Run the complete AI news research and digest compilation workflow with execution time limit
         
+        Args:
+            max_articles: Maximum number of AI articles to process
+            filter_criteria: Optional criteria to filter AI articles
+            
+        Returns:
+            Path to the generated AI news digest file
+        """
+        return asyncio.run(self.run_async(max_articles=max_articles, filter_criteria=filter_criteria))
+    
+    async def run_async(self, max_articles: Optional[int] = None, filter_criteria: Optional[str] = None) -> str:
+        """
+        Async counterpart of run()
+        
+        The whole workflow runs under a single asyncio deadline, so hitting
+        config.MAX_EXECUTION_TIME_SECONDS cancels in-flight API calls instead
+        of waiting for the current phase to end. Summaries finished before the
+        deadline are still saved as a partial digest.
+        
         Args:
             max_articles: Maximum number of AI articles to process
             filter_criteria: Optional criteria to filter AI articles
@@ -41,122 +78,216 @@ class NewsResearchOrchestrator:
         start_time = time.time()
         max_execution_time = config.MAX_EXECUTION_TIME_SECONDS
         
-        print("\n" + "="*70)
-        print("STARTING AI NEWS RESEARCH WORKFLOW")
-        print("="*70)
-        print(f"[TIME] Maximum execution time: {max_execution_time} seconds ({max_execution_time/60:.1f} minutes)")
-        print(f"[DATE] Article age limit: {config.MAX_ARTICLE_AGE_DAYS} days")
-        print(f"[NEWS] Maximum AI articles: {max_articles or config.MAX_ARTICLES}")
-        
-        # Step 1: Fetch AI news articles
-        print("\n>>> PHASE 1: AI News Collection")
-        articles = self.fetcher.fetch_news(max_articles=max_articles)
+        _print_block(
+            "\n" + "="*70,
+            "STARTING AI NEWS RESEARCH WORKFLOW",
+            "="*70,
+            f"[TIME] Maximum execution time: {max_execution_time} seconds ({max_execution_time/60:.1f} minutes)",
+            f"[DATE] Article age limit: {config.MAX_ARTICLE_AGE_DAYS} days",
+            f"[NEWS] Maximum AI articles: {max_articles or config.MAX_ARTICLES}"
+        )
         
-        # Check execution time
-        elapsed_time = time.time() - start_time
-        if elapsed_time > max_execution_time:
+        # Filled in by _workflow as phases finish, for salvaging a timed-out run
+        state = {}
+        try:
+            filepath, article_count = await asyncio.wait_for(
+                self._workflow(max_articles, filter_criteria, state), timeout=max_execution_time
+            )
+        except asyncio.TimeoutError:
+            elapsed_time = time.time() - start_time
             print(f"\n[!] Execution time limit exceeded ({elapsed_time:.1f}s). Stopping workflow.")
-            return None
+            return self._save_partial_digest(state)
+        finally:
+            # The async clients' connection pools die with this event loop
+            await asyncio.gather(self.fetcher.aclose(), self.summarizer.aclose(), self.compiler.aclose())
         
-        if not articles:
-            print("\n[-] No AI articles fetched. Exiting.")
+        if filepath is None:
             return None
         
-        # Step 2: Filter articles if criteria provided
-        if filter_criteria:
-            elapsed_time = time.time() - start_time
-            if elapsed_time > max_execution_time:
-                print(f"\n[!] Execution time limit exceeded ({elapsed_time:.1f}s). Stopping workflow.")
-                return None
-                
-            print(f"\n>>> PHASE 2: AI Article Filtering (Criteria: {filter_criteria})")
-            articles = self.fetcher.filter_articles(articles, filter_criteria)
+        # Summary
+        total_time = time.time() - start_time
+        _print_block(
+            "\n" + "="*70,
+            "AI NEWS RESEARCH WORKFLOW COMPLETED SUCCESSFULLY",
+            "="*70,
+            f"\n[+] Processed {article_count} AI articles",
+            "[+] Generated AI summaries and insights",
+            f"[+] Compiled AI news digest saved to: {filepath}",
+            f"[TIME] Total execution time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)",
+            "\n" + "="*70
+        )
         
-        # Step 3: Summarize AI articles
-        elapsed_time = time.time() - start_time
-        if elapsed_time > max_execution_time:
-            print(f"\n[!] Execution time limit exceeded ({elapsed_time:.1f}s). Stopping workflow.")
-            return None
-            
-        print("\n>>> PHASE 3: AI Article Summarization")
-        summarized_articles = self.summarizer.summarize_articles(articles)
+        return filepath
+    
+    def _save_partial_digest(self, state: Dict[str, Any]) -> Optional[str]:
+        """
+        Save whatever summaries a timed-out run finished as a digest
         
-        # Step 4: Identify AI themes
-        elapsed_time = time.time() - start_time
-        if elapsed_time > max_execution_time:
-            print(f"\n[!] Execution time limit exceeded ({elapsed_time:.1f}s). Stopping workflow.")
-            return None
+        Rendered locally, so it adds no API calls after the deadline; the next
+        run resumes the remaining articles from the summary checkpoint.
+        
+        Args:
+            state: Progress recorded by _workflow
             
-        print("\n>>> PHASE 4: AI Theme Identification")
-        themes = self.summarizer.identify_themes(summarized_articles)
-        print(f"\n{themes}")
+        Returns:
+            Path to the partial digest, or None if nothing was summarized yet
+        """
+        articles = state.get("articles")
+        if not articles:
+            return None
         
-        # Step 5: Compile AI news digest
-        elapsed_time = time.time() - start_time
-        if elapsed_time > max_execution_time:
-            print(f"\n[!] Execution time limit exceeded ({elapsed_time:.1f}s). Stopping workflow.")
+        summarized_articles = state.get("summarized_articles") or self.summarizer.completed_summaries(articles)
+        if not summarized_articles:
             return None
-            
+        
+        print(f"[!] Saving a partial digest with {len(summarized_articles)} of {len(articles)} articles")
+        scaffold = self.compiler.prepare_scaffold(summarized_articles)
+        return self.compiler.save_digest(self.compiler.iter_digest(scaffold, state.get("themes")))
+    
+    @staticmethod
+    async def _in_thread(func, *args):
+        """Run a blocking phase in a worker thread so the deadline can still fire"""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+    
+    async def _compile(self, summarized_articles: List[Dict[str, Any]],
+                       themes_task: "asyncio.Future") -> Union[str, Iterable[str]]:
+        """Phase 5: build the digest, overlapping local rendering with the theme call"""
         print("\n>>> PHASE 5: AI News Digest Compilation")
         
-        if config.DIGEST_FORMAT == "markdown":
-            # Use structured markdown format
-            digest = self.compiler.format_digest_markdown(summarized_articles, themes)
-        else:
+        if config.USE_LLM_COMPILATION:
+            themes = await themes_task
+            if themes:
+                print(f"\n{themes}")
             # Use AI to compile in desired format
-            digest = self.compiler.compile_digest(summarized_articles, themes)
+            return await self._in_thread(self.compiler.compile_digest, summarized_articles, themes)
+        
+        # Render locally from the summaries (no API call)
+        scaffold = self.compiler.prepare_scaffold(summarized_articles)
+        themes = await themes_task
+        if themes:
+            print(f"\n{themes}")
+        # Sections are rendered lazily as save_digest writes them out
+        return self.compiler.iter_digest(scaffold, themes)
+    
+    async def _workflow(self, max_articles: Optional[int], filter_criteria: Optional[str],
+                        state: Dict[str, Any]) -> Tuple[Optional[str], int]:
+        """
+        Phases 1-6 of the workflow
+        
+        Args:
+            max_articles: Maximum number of AI articles to process
+            filter_criteria: Optional criteria to filter AI articles
+            state: Receives "articles", "summarized_articles" and "themes" as
+                they become available
+            
+        Returns:
+            Tuple of (digest path or None if there was nothing to digest, article count)
+        """
+        # Step 1: Fetch AI news articles
+        print("\n>>> PHASE 1: AI News Collection")
+        articles = await self.fetcher.fetch_news_async(max_articles)
+        
+        if not articles:
+            print("\n[-] No AI articles fetched. Exiting.")
+            return None, 0
+        
+        # Step 2: Filter articles if criteria provided
+        if filter_criteria:
+            print(f"\n>>> PHASE 2: AI Article Filtering (Criteria: {filter_criteria})")
+            articles = await self._in_thread(self.fetcher.filter_articles, articles, filter_criteria)
+            
+            if not articles:
+                print("\n[-] No AI articles match the filter criteria. Exiting.")
+                return None, 0
+        state["articles"] = articles
+        
+        # Steps 3-4: Summarize AI articles and identify themes concurrently
+        print("\n>>> PHASE 3-4: AI Article Summarization + Theme Identification (concurrent)")
+        themes_task = None
+        try:
+            if config.USE_BATCH_API:
+                # Batch results arrive all at once; themes can use the finished summaries
+                summarized_articles = await self.summarizer.summarize_articles_async(articles)
+                themes_task = asyncio.ensure_future(self.summarizer.identify_themes_async(summarized_articles))
+            else:
+                # Themes only need titles and descriptions, so start them first and let
+                # them run behind summarization and the digest scaffold
+                themes_task = asyncio.ensure_future(self.summarizer.identify_themes_async(articles))
+                summarized_articles = await self.summarizer.summarize_articles_async(articles)
+            state["summarized_articles"] = summarized_articles
+            
+            # Step 5: Compile AI news digest
+            digest = await self._compile(summarized_articles, themes_task)
+        finally:
+            # Don't leave the theme call running if the deadline cancelled us,
+            # but keep its result for a partial digest if it already finished
+            if themes_task is not None:
+                if themes_task.done() and not themes_task.cancelled() and themes_task.exception() is None:
+                    state["themes"] = themes_task.result()
+                themes_task.cancel()
         
         # Step 6: Save AI news digest
         print("\n>>> PHASE 6: Saving AI News Digest")
         filepath = self.compiler.save_digest(digest)
         
-        # Summary
-        total_time = time.time() - start_time
-        print("\n" + "="*70)
-        print("AI NEWS RESEARCH WORKFLOW COMPLETED SUCCESSFULLY")
-        print("="*70)
-        print(f"\n[+] Processed {len(articles)} AI articles")
-        print(f"[+] Generated AI summaries and insights")
-        print(f"[+] Compiled AI news digest saved to: {filepath}")
-        print(f"[TIME] Total execution time: {total_time:.1f} seconds ({total_time/60:.1f} minutes)")
-        print("\n" + "="*70)
-        
-        return filepath
+        return filepath, len(articles)
     
-    def run_interactive(self):
-        """Run in interactive mode with user prompts"""
-        print("\n" + "="*70)
-        print("INTERACTIVE MODE")
-        print("="*70)
+    def run_interactive(self, run_config: Optional[RunConfig] = None):
+        """
+        Run in interactive mode with user prompts
+        
+        Command-line options pre-fill the answers. Without a terminal (e.g.
+        under CI) nothing is prompted and those options are used as-is, so
+        the run never blocks on input().
+        
+        Args:
+            run_config: Parsed command-line options
+        """
+        run_config = run_config or RunConfig(interactive=True)
+        max_articles = run_config.max_articles or config.MAX_ARTICLES
+        filter_criteria = run_config.filter_criteria
+        
+        _print_block("\n" + "="*70, "INTERACTIVE MODE", "="*70)
+        
+        if not sys.stdin.isatty():
+            print("\n[!] No terminal attached, using command-line options")
+            return self.run(max_articles=max_articles, filter_criteria=filter_criteria)
         
         # Get user preferences
         try:
-            max_articles = input(f"\nMaximum articles to process (default {config.MAX_ARTICLES}): ").strip()
-            max_articles = int(max_articles) if max_articles else config.MAX_ARTICLES
+            answer = input(f"\nMaximum articles to process (default {max_articles}): ").strip()
+            max_articles = int(answer) if answer else max_articles
         except ValueError:
-            max_articles = config.MAX_ARTICLES
+            pass
         
-        filter_criteria = input("\nFilter criteria (e.g., 'GPT-4, LLMs, OpenAI' or press Enter to skip): ").strip()
-        filter_criteria = filter_criteria if filter_criteria else None
+        answer = input("\nFilter criteria (e.g., 'GPT-4, LLMs, OpenAI' or press Enter to skip): ").strip()
+        filter_criteria = answer or filter_criteria
         
         # Run workflow
         return self.run(max_articles=max_articles, filter_criteria=filter_criteria)
 
 
+@lru_cache(maxsize=1)
+def get_orchestrator() -> NewsResearchOrchestrator:
+    """
+    Shared orchestrator for callers running several workflows in one process
+    
+    Building the agents creates API clients and caches; one set serves every
+    run. run() can be called repeatedly on the same instance.
+    """
+    return NewsResearchOrchestrator()
+
+
 def main():
     """Main entry point"""
-    import sys
-    
+    run_config = parse_args()
     orchestrator = NewsResearchOrchestrator()
     
-    # Check for command line arguments
-    if len(sys.argv) > 1 and sys.argv[1] == "--interactive":
-        orchestrator.run_interactive()
+    if run_config.interactive:
+        orchestrator.run_interactive(run_config)
     else:
-        # Run with defaults
-        orchestrator.run()
+        orchestrator.run(max_articles=run_config.max_articles, filter_criteria=run_config.filter_criteria)
 
 
 if __name__ == "__main__":
     main()
-